@@ -0,0 +1,160 @@
+#!/usr/bin/env python
+# encoding: utf-8
+
+from Bio import Entrez
+from difflib import SequenceMatcher
+from richcontext import scholapi as rc_scholapi
+import json
+import random
+import requests
+import string
+import sys
+import timeit
+import xmltodict
+
+
+######################################################################
+## micro-benchmarks for parsing API responses
+
+def load_payloads (schol, paths):
+    """
+    load the payloads recorded in the given files, otherwise record
+    PubMed and ORCID XML payloads plus a DataCite JSON result page
+    from their APIs
+    """
+    if len(paths) > 0:
+        payloads = {}
+
+        for path in paths:
+            with open(path, "rb") as f:
+                payloads[path] = f.read()
+
+        return payloads
+
+    Entrez.email = schol.config["DEFAULT"]["email"]
+    handle = Entrez.read(Entrez.esearch(db="pubmed", retmax=100, term="NHANES"))
+    fetch_result = Entrez.efetch(db="pubmed", id=",".join(handle["IdList"]), retmode="xml")
+
+    payloads = {
+        "pubmed": fetch_result.read(),
+        "orcid": requests.get(schol.orcid._get_api_url("0000-0002-8139-2960", "works")).content,
+        "datacite.json": requests.get(schol.datacite._get_api_url("?resource-type-id=text&query=titles.title:NHANES&page[size]=100")).content,
+        }
+
+    fetch_result.close()
+    return payloads
+
+
+def bench_xml_to_dict (payloads, number=20):
+    """
+    compare the JSON round trip with the direct conversion of XML
+    into plain dicts and lists
+    """
+    for name, xml in payloads.items():
+        round_trip = lambda: json.loads(json.dumps(xmltodict.parse(xml)))
+        direct = lambda: rc_scholapi.scholapi._ScholInfra._xml_to_dict(xml)
+
+        # both paths must produce exactly the same structure
+        assert round_trip() == direct()
+
+        # best of several runs, to reduce the noise from GC and other processes
+        t_round_trip = min(timeit.repeat(round_trip, number=number, repeat=5)) / number * 1000.0
+        t_direct = min(timeit.repeat(direct, number=number, repeat=5)) / number * 1000.0
+
+        print("{}: {} bytes".format(name, len(xml)))
+        print("  json round trip: {:.3f} ms".format(t_round_trip))
+        print("  direct:          {:.3f} ms ({:.1f}% faster)".format(t_direct, (1.0 - t_direct / t_round_trip) * 100.0))
+
+
+def perturb_title (title, rng, edits=3):
+    """
+    a near miss for a title, with a few random character edits, as
+    from a typo or a different transliteration
+    """
+    chars = list(title)
+
+    for i in range(edits):
+        pos = rng.randrange(len(chars))
+        op = rng.choice(["delete", "substitute", "insert"])
+
+        if op == "delete" and len(chars) > 1:
+            del chars[pos]
+        elif op == "substitute":
+            chars[pos] = rng.choice(string.ascii_lowercase)
+        else:
+            chars.insert(pos, rng.choice(string.ascii_lowercase))
+
+    return "".join(chars)
+
+
+def bench_title_similarity (pages, number=5):
+    """
+    compare per-query CPU for matching a title among the candidates on
+    a DataCite result page, using SequenceMatcher as before versus the
+    banded Levenshtein similarity with its early exit; the queries are
+    either near misses of titles on the page, or titles with their
+    words shuffled, which match nothing -- not the page's own titles,
+    which would find an exact match first
+    """
+    rng = random.Random(0)
+
+    for name, page in pages.items():
+        titles = [
+            title_obj["title"]
+            for entry in json.loads(page)["data"]
+            for title_obj in entry["attributes"]["titles"]
+            ]
+
+        def sequence_matcher (query):
+            max_score = 0.0
+
+            for title in titles:
+                s = SequenceMatcher(None, title, query)
+
+                if (s.ratio() > max_score):
+                    max_score = s.ratio()
+
+            return max_score >= 0.9
+
+        def levenshtein (query):
+            max_score = 0.0
+
+            for title in titles:
+                score = rc_scholapi.scholapi._ScholInfra.title_similarity(title, query, max(max_score, 0.9))
+
+                if score > max_score:
+                    max_score = score
+
+            return max_score >= 0.9
+
+        def time_per_query (match, queries):
+            # clear the memoized normalization before each run, so
+            # that every run pays for normalizing the titles
+            clear = rc_scholapi.scholapi._normalize_title.cache_clear
+            run = lambda: [ match(q) for q in queries ]
+            return min(timeit.repeat(run, setup=clear, number=1, repeat=number)) / len(queries) * 1000.0
+
+        near_misses = [ perturb_title(title, rng) for title in titles[:50] ]
+        shuffled = [ " ".join(rng.sample(title.split(), len(title.split()))) for title in titles[:50] ]
+
+        print("{}: {} titles".format(name, len(titles)))
+
+        for label, queries in [ ("near misses", near_misses), ("shuffled", shuffled) ]:
+            matched = sum(levenshtein(q) for q in queries)
+            t_sequence_matcher = time_per_query(sequence_matcher, queries)
+            t_levenshtein = time_per_query(levenshtein, queries)
+
+            print("  {} ({} of {} matched):".format(label, matched, len(queries)))
+            print("    SequenceMatcher: {:.3f} ms per query".format(t_sequence_matcher))
+            print("    levenshtein:     {:.3f} ms per query ({:.1f}% faster)".format(t_levenshtein, (1.0 - t_levenshtein / t_sequence_matcher) * 100.0))
+
+
+######################################################################
+## main entry point
+
+if __name__ == "__main__":
+    schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg", logger=None)
+    payloads = load_payloads(schol, sys.argv[1:])
+
+    bench_xml_to_dict({ name: payload for name, payload in payloads.items() if not name.endswith(".json") })
+    bench_title_similarity({ name: payload for name, payload in payloads.items() if name.endswith(".json") })
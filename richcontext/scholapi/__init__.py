@@ -1 +1 @@
-from .scholapi import ScholInfraAPI
+from .scholapi import AsyncScholInfraAPI, ScholInfraAPI, TitleKey
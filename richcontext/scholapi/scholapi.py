@@ -3,46 +3,806 @@
 
 from Bio import Entrez
 from bs4 import BeautifulSoup
-from collections import OrderedDict
-from difflib import SequenceMatcher
+from collections import OrderedDict, deque
+from requests.adapters import HTTPAdapter
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options  
 from selenium.webdriver.common.by import By
 from selenium.webdriver.common.keys import Keys
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import WebDriverWait
+from xml.etree import ElementTree
+import aiohttp
+import asyncio
 import cProfile
+import concurrent.futures
 import configparser
-import crossref_commons.retrieval
+import contextlib
+import contextvars
 import csv
 import dimcli
+import email.utils
+import functools
+import html
+import http.client
 import json
 import io
+import itertools
 import logging
+import math
+import pickle
 import pprint
 import pstats
+import random
 import re
 import requests
 import requests_cache
+import sqlite3
 import sys
+import threading
 import time
 import traceback
+import unicodedata
+import urllib.error
 import urllib.parse
+import urllib.request
+import urllib3
 import warnings
 import xmltodict
 
 
+## XML namespace prefixes used to match tag names when parsing with
+## ElementTree, which (unlike BeautifulSoup) resolves them to URIs
+_XML_NAMESPACES = {
+    "oaf": "http://namespace.openaire.eu/oaf",
+    }
+
+## ElementTree tags seen so far, with their namespace URI and lowercase
+## local name
+_XML_TAG_KEYS = {}
+
+## default number of seconds until cached API responses expire
+_CACHE_EXPIRE = 7 * 24 * 3600
+
+## default number of seconds until a cached "no match" expires
+_NEGATIVE_CACHE_EXPIRE = 24 * 3600
+
+## HTTP status codes for transient errors, where the request gets retried
+_RETRY_STATUS = frozenset([ 429, 500, 502, 503, 504 ])
+
+## seconds per unit, for the interval in rate limit headers
+_INTERVAL_UNITS = {
+    "ms": 0.001,
+    "s": 1.0,
+    "m": 60.0,
+    "h": 3600.0,
+    }
+
+## characters stripped from either end of a title before comparing it
+_TITLE_STRIP = " \"'?!.,"
+
+## typographic quotes, which get unified with their ASCII forms
+_TITLE_QUOTES = {
+    "'": "\u2018\u2019\u201a\u201b\u2032\u2035\u00b4\u0060",
+    '"': "\u201c\u201d\u201e\u201f\u2033\u2036\u00ab\u00bb",
+    }
+
+## Unicode dash punctuation, plus the minus sign which gets used as a
+## dash, which get unified with the ASCII hyphen
+_TITLE_DASHES = (
+    "\u058a\u05be\u1400\u1806\u2010\u2011\u2012\u2013\u2014\u2015\u2212"
+    "\u2e17\u2e1a\u2e3a\u2e3b\u2e40\u2e5d\u301c\u3030\u30a0\ufe31\ufe32"
+    "\ufe58\ufe63\uff0d\U00010ead"
+    )
+
+## `str.translate()` table for titles after NFKD decomposition, which
+## deletes the nonspacing marks that it splits off from the letters
+## they accent (in any script, e.g., Hebrew points or Arabic harakat)
+## and maps typographic dashes and quotes to their ASCII forms; the
+## code points up to U+07FF (Latin through Arabic) map to themselves,
+## since each lookup which misses the table costs a `KeyError`, and
+## only planes 0, 1, and 14 have nonspacing marks
+_TITLE_TRANSLATION = dict(
+    [ (c, c) for c in range(0x800) ] +
+    [ (c, None) for c in itertools.chain(range(0x20000), range(0xE0000, 0xE1000)) if unicodedata.category(chr(c)) == "Mn" ] +
+    [ (ord(dash), "-") for dash in _TITLE_DASHES ] +
+    [ (ord(quote), ascii_quote) for ascii_quote, quotes in _TITLE_QUOTES.items() for quote in quotes ]
+    )
+
+## default discovery services for the federated API methods, i.e.,
+## those which support each method without running a browser
+_FEDERATED_PROVIDERS = {
+    "publication_lookup": [
+        "crossref",
+        "datacite",
+        "dissemin",
+        "semantic",
+        "unpaywall",
+        "core",
+        "ssrn",
+        ],
+    "title_search": [
+        "crossref",
+        "europepmc",
+        "openaire",
+        "pubmed",
+        "dimensions",
+        "datacite",
+        "core",
+        ],
+    }
+
+
+class _RateLimiter:
+    """
+    token bucket which limits the request rate for one provider,
+    shared by every thread and coroutine that uses the provider
+    """
+
+    def __init__ (self, rate=None, burst=None, adaptive=True):
+        self.rate = None
+        self.burst = None
+        self.adaptive = adaptive
+        self._tokens = None
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+        self.set_rate(rate, burst)
+
+
+    def set_rate (self, rate, burst=None):
+        """
+        change the rate, in requests per second, where `None` means no
+        limit; the bucket holds up to `burst` requests, by default one
+        second's worth
+        """
+        with self._lock:
+            self.rate = float(rate) if rate else None
+            self.burst = max(float(burst or self.rate or 1.0), 1.0)
+            self._tokens = self.burst if self._tokens is None else min(self._tokens, self.burst)
+
+
+    def delay (self):
+        """
+        reserve a token for one request, returning the number of
+        seconds to wait before making it -- callers which arrive while
+        the bucket is empty queue up behind the earlier reservations
+        """
+        with self._lock:
+            if not self.rate:
+                return 0.0
+
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1.0
+
+            if self._tokens >= 0.0:
+                return 0.0
+            else:
+                return -self._tokens / self.rate
+
+
+    def acquire (self):
+        """
+        block the calling thread until the next request is permitted
+        """
+        wait = self.delay()
+
+        if wait > 0.0:
+            time.sleep(wait)
+
+
+    def update (self, headers):
+        """
+        adapt to the `X-Rate-Limit-Limit` and `X-Rate-Limit-Interval`
+        response headers, e.g., from Crossref, unless the rate has been
+        set explicitly in the configuration
+        """
+        if not self.adaptive or not headers:
+            return
+
+        limit = headers.get("X-Rate-Limit-Limit")
+        interval = headers.get("X-Rate-Limit-Interval")
+
+        if not limit or not interval:
+            return
+
+        match = re.match(r"\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h)?\s*$", interval)
+
+        if match:
+            seconds = float(match.group(1)) * _INTERVAL_UNITS[match.group(2) or "s"]
+
+            if seconds > 0.0:
+                rate = float(limit) / seconds
+
+                if rate != self.rate:
+                    self.set_rate(rate, limit)
+
+
+## absolute deadline, in terms of `time.monotonic()`, for the API
+## access methods called within the current context
+_DEADLINE = contextvars.ContextVar("deadline", default=None)
+
+
+def _set_deadline (deadline):
+    """
+    set the deadline for the current context, unless an earlier one
+    has already been set; returns a token to reset it
+    """
+    current = _DEADLINE.get()
+
+    if current is not None:
+        deadline = min(deadline, current)
+
+    return _DEADLINE.set(deadline)
+
+
+def _time_remaining ():
+    """
+    seconds remaining until the deadline for the current context, or
+    `None` if there isn't one
+    """
+    deadline = _DEADLINE.get()
+
+    if deadline is None:
+        return None
+    else:
+        return deadline - time.monotonic()
+
+
+@contextlib.contextmanager
+def _deadline (seconds):
+    """
+    bound the total time of the API access methods called within the
+    `with` block, including all of their retries
+    """
+    if seconds is None:
+        yield
+    else:
+        token = _set_deadline(time.monotonic() + seconds)
+
+        try:
+            yield
+        finally:
+            _DEADLINE.reset(token)
+
+
+class _DeadlineExceeded (Exception):
+    """
+    raised instead of making a request once the deadline has passed
+    """
+    pass
+
+
+## socket timeout for the Entrez requests made within the current
+## context, since Biopython doesn't pass one to `urlopen()`
+_ENTREZ_TIMEOUT = contextvars.ContextVar("entrez_timeout", default=None)
+
+
+def _entrez_urlopen (request, *args, **kwargs):
+    """
+    `urlopen()` for Biopython's Entrez module, with the timeout set by
+    `_ScholInfra_PubMed._entrez_setup()`
+    """
+    timeout = _ENTREZ_TIMEOUT.get()
+
+    if timeout is not None:
+        kwargs.setdefault("timeout", timeout)
+
+    return urllib.request.urlopen(request, *args, **kwargs)
+
+
+class _CircuitOpenError (Exception):
+    """
+    raised instead of making a request while a provider's circuit
+    breaker is open
+    """
+    pass
+
+
+class _CircuitBreaker:
+    """
+    circuit breaker for one provider: after `threshold` consecutive
+    failed requests it opens, so that calls fail fast instead of each
+    waiting on a provider which is down; then after `reset` seconds it
+    lets one probe request through (half-open), which either closes
+    the circuit again or reopens it
+    """
+
+    def __init__ (self, threshold=5, reset=60.0):
+        self.threshold = threshold
+        self.reset = reset
+        self.failures = 0
+        self._opened = None
+        self._probing = False
+        self._lock = threading.Lock()
+
+
+    def is_open (self):
+        """
+        would a request be refused right now?
+        """
+        with self._lock:
+            if self._opened is None:
+                return False
+            else:
+                return self._probing or time.monotonic() - self._opened < self.reset
+
+
+    def allow (self):
+        """
+        may a request be made? once the reset period has elapsed, only
+        the first caller gets through, as the probe
+        """
+        with self._lock:
+            if self._opened is None:
+                return True
+            elif not self._probing and time.monotonic() - self._opened >= self.reset:
+                self._probing = True
+                return True
+            else:
+                return False
+
+
+    def record_success (self):
+        with self._lock:
+            self.failures = 0
+            self._opened = None
+            self._probing = False
+
+
+    def record_failure (self):
+        with self._lock:
+            self.failures += 1
+
+            if self._probing or (self.threshold and self.failures >= self.threshold):
+                self._opened = time.monotonic()
+
+            self._probing = False
+
+
+    def release (self):
+        """
+        give up a probe without an outcome, e.g., when the caller ran
+        out of time, so that another request can probe instead
+        """
+        with self._lock:
+            self._probing = False
+
+
+class _ResultCache:
+    """
+    persistent cache for the results of API access methods which the
+    HTTP cache cannot handle, such as negative results, in one SQLite
+    table with a namespace per provider and an expiration per entry
+    """
+
+    def __init__ (self, path):
+        self.path = path
+        self._conn = None
+        self._lock = threading.Lock()
+
+
+    def _connect (self):
+        if not self._conn:
+            self._conn = sqlite3.connect(self.path, check_same_thread=False)
+            self._conn.execute("CREATE TABLE IF NOT EXISTS results (namespace TEXT, key TEXT, expires REAL, value BLOB, PRIMARY KEY (namespace, key))")
+
+        return self._conn
+
+
+    def get (self, namespace, key):
+        """
+        returns a `(found, value)` pair, where expired entries are not
+        found
+        """
+        with self._lock:
+            row = self._connect().execute(
+                "SELECT expires, value FROM results WHERE namespace = ? AND key = ?",
+                (namespace, key)
+                ).fetchone()
+
+        if row is None or (row[0] >= 0 and row[0] < time.time()):
+            return False, None
+        else:
+            return True, pickle.loads(row[1])
+
+
+    def set (self, namespace, key, value, expire):
+        """
+        store a value which expires in `expire` seconds, or never if
+        that's negative
+        """
+        expires = -1 if expire < 0 else time.time() + expire
+
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?)",
+                (namespace, key, expires, pickle.dumps(value))
+                )
+            conn.commit()
+
+
+    def clear (self, namespace=None):
+        with self._lock:
+            conn = self._connect()
+
+            if namespace is None:
+                conn.execute("DELETE FROM results")
+            else:
+                conn.execute("DELETE FROM results WHERE namespace = ?", (namespace,))
+
+            conn.commit()
+
+
+    def close (self):
+        with self._lock:
+            if self._conn:
+                self._conn.close()
+                self._conn = None
+
+
+## URLs requested through the HTTP cache within the current context,
+## so that a title search which found no match can evict them
+_REQUESTED_URLS = contextvars.ContextVar("requested_urls", default=None)
+
+
+@contextlib.contextmanager
+def _track_requests ():
+    """
+    collect the URLs which `_get()` requests within the `with` block
+    """
+    urls = []
+    token = _REQUESTED_URLS.set(urls)
+
+    try:
+        yield urls
+    finally:
+        _REQUESTED_URLS.reset(token)
+
+
+def _negative_cache (method):
+    """
+    decorator for a `title_search()` method, which skips the API call
+    for a query that recently found no match, i.e., a response with
+    neither metadata nor an error message
+    """
+    @functools.wraps(method)
+    def wrapper (self, query):
+        response = self._get_known_miss(method.__name__, query)
+
+        if response is None:
+            with _track_requests() as urls:
+                response = method(self, query)
+
+            self._record_miss(method.__name__, query, response, urls)
+
+        return response
+
+    wrapper.negative_cache = True
+    return wrapper
+
+
+class _LatencyTracker:
+    """
+    the most recent request latencies for one provider, to estimate
+    percentiles of its response time
+    """
+
+    def __init__ (self, size=100, min_samples=20):
+        self.min_samples = min_samples
+        self._samples = deque(maxlen=size)
+        self._lock = threading.Lock()
+
+
+    def add (self, seconds):
+        with self._lock:
+            self._samples.append(seconds)
+
+
+    def percentile (self, p):
+        """
+        the `p`-th percentile latency in seconds, or `None` until there
+        are enough samples for a useful estimate
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+
+        if len(samples) < self.min_samples:
+            return None
+        else:
+            i = int(math.ceil(p / 100.0 * len(samples))) - 1
+            return samples[min(max(i, 0), len(samples) - 1)]
+
+
+@functools.lru_cache(maxsize=65536)
+def _normalize_title (title):
+    """
+    memoized title normalization, since the same titles (queries and
+    their candidates) get compared many times over in batch runs:
+    unescape HTML entities, fold diacritics, dashes, and quotes, then
+    collapse whitespace, strip punctuation from the ends, and fold case
+    """
+    if "&" in title:
+        title = html.unescape(title)
+
+    if not title.isascii():
+        title = unicodedata.normalize("NFKD", title).translate(_TITLE_TRANSLATION)
+
+    return " ".join(title.split()).strip(_TITLE_STRIP).casefold()
+
+
+class TitleKey:
+    """
+    a title normalized once, for comparing it with many other titles,
+    or for use as a dict key when reconciling titles in batches, e.g.,
+    `TitleKey("Deal or no deal?") == TitleKey("deal or no deal")`
+    """
+    __slots__ = ("title", "key")
+
+    def __init__ (self, title):
+        if isinstance(title, TitleKey):
+            self.title = title.title
+            self.key = title.key
+        else:
+            self.title = title
+            self.key = _normalize_title(title) if title else ""
+
+
+    def __eq__ (self, other):
+        if isinstance(other, TitleKey):
+            return self.key == other.key
+        else:
+            return NotImplemented
+
+
+    def __hash__ (self):
+        return hash(self.key)
+
+
+    def __bool__ (self):
+        return bool(self.title)
+
+
+    def __str__ (self):
+        return self.key
+
+
+    def __repr__ (self):
+        return "TitleKey({!r})".format(self.title)
+
+
+def _levenshtein_ratio (a, b, threshold=0.0):
+    """
+    normalized Levenshtein similarity of two strings, from 0.0 to
+    1.0 -- computed only within the band of edit distances which could
+    reach `threshold`, and returning 0.0 as soon as it's known to fall
+    below that
+    """
+    if a == b:
+        return 1.0
+
+    longest = max(len(a), len(b))
+    k = int((1.0 - threshold) * longest + 1e-9)
+
+    if abs(len(a) - len(b)) > k:
+        return 0.0
+
+    # a common prefix or suffix doesn't change the edit distance
+    i = 0
+
+    while i < len(a) and i < len(b) and a[i] == b[i]:
+        i += 1
+
+    j = 0
+
+    while j < len(a) - i and j < len(b) - i and a[-1 - j] == b[-1 - j]:
+        j += 1
+
+    a = a[i:len(a) - j]
+    b = b[i:len(b) - j]
+
+    if len(a) > len(b):
+        a, b = b, a
+
+    n = len(a)
+    m = len(b)
+    big = k + 1
+
+    prev = [ c if c <= k else big for c in range(m + 1) ]
+    cur = [ big ] * (m + 1)
+
+    for i in range(1, n + 1):
+        lo = max(1, i - k)
+        hi = min(m, i + k)
+        cur[lo - 1] = i if lo == 1 else big
+        row_min = cur[lo - 1]
+        ca = a[i - 1]
+
+        for j in range(lo, hi + 1):
+            d = prev[j - 1] if ca == b[j - 1] else prev[j - 1] + 1
+            x = prev[j] + 1
+
+            if x < d:
+                d = x
+
+            x = cur[j - 1] + 1
+
+            if x < d:
+                d = x
+
+            cur[j] = d
+
+            if d < row_min:
+                row_min = d
+
+        if hi < m:
+            cur[hi + 1] = big
+
+        if row_min > k:
+            return 0.0
+
+        prev, cur = cur, prev
+
+    dist = prev[m]
+
+    if dist > k:
+        return 0.0
+    else:
+        return 1.0 - dist / longest
+
+
+class _BrowserPool:
+    """
+    bounded pool of long-lived headless browsers, which get started
+    lazily, checked before each use, and recycled after `max_uses`
+    """
+
+    def __init__ (self, factory, size=2, max_uses=100):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = []
+        self._count = 0
+        self._closed = False
+        self._cond = threading.Condition()
+
+
+    @contextlib.contextmanager
+    def browser (self):
+        """
+        context manager which borrows a browser from the pool, e.g.,
+        `with pool.browser() as browser: ...`; after an exception, the
+        browser only gets quit rather than reused if its session died,
+        since e.g. an element not being found is an ordinary outcome
+        """
+        entry = self._acquire()
+        ok = False
+
+        try:
+            yield entry[0]
+            ok = True
+        except BaseException:
+            ok = self._is_alive(entry[0])
+            raise
+        finally:
+            self._release(entry, ok)
+
+
+    @classmethod
+    def _is_alive (cls, browser):
+        """
+        health check: a browser which crashed or lost its driver can't
+        report its current URL
+        """
+        try:
+            browser.current_url
+            return True
+        except Exception:
+            return False
+
+
+    def _acquire (self):
+        """
+        wait for an idle browser which passes its health check,
+        otherwise start a new one while the pool has room
+        """
+        while True:
+            with self._cond:
+                while not self._idle and self._count >= self.size:
+                    self._cond.wait()
+
+                if self._idle:
+                    entry = self._idle.pop()
+                else:
+                    entry = None
+                    self._count += 1
+
+            if entry is None:
+                try:
+                    return [ self.factory(), 0 ]
+                except BaseException:
+                    self._discard(None)
+                    raise
+            elif self._is_alive(entry[0]):
+                return entry
+            else:
+                self._discard(entry)
+
+
+    def _release (self, entry, ok):
+        entry[1] += 1
+
+        with self._cond:
+            if ok and not self._closed and entry[1] < self.max_uses:
+                self._idle.append(entry)
+                self._cond.notify()
+                return
+
+        self._discard(entry)
+
+
+    def _discard (self, entry):
+        """
+        quit a browser, making room in the pool for another
+        """
+        if entry:
+            try:
+                entry[0].quit()
+            except Exception:
+                pass
+
+        with self._cond:
+            self._count -= 1
+            self._cond.notify()
+
+
+    def close (self):
+        """
+        quit the idle browsers; any which are still borrowed get quit
+        once they're returned
+        """
+        with self._cond:
+            self._closed = True
+            idle, self._idle = self._idle, []
+
+        for entry in idle:
+            self._discard(entry)
+
+
 class _ScholInfra:
     """
     methods for accessing a specific Scholarly Infrastructure API
     """
 
-    def __init__ (self, parent=None, name="Generic", api_url=None, cgi_url=None):
+    def __init__ (self, parent=None, name="Generic", api_url=None, cgi_url=None, response_class=None, rate_limit=None, rate_burst=None, cache_expire=_CACHE_EXPIRE):
         self.parent = parent
         self.name = name
         self.api_url = api_url
         self.cgi_url = cgi_url
         self.api_obj = None
+        self.response_class = response_class or _ScholInfraResponse
+        self.rate_limit = rate_limit
+        self.rate_burst = rate_burst
+        self.cache_expire = cache_expire
+        self._session = None
+        self._session_lock = threading.Lock()
+
+        self._rate_limiter = _RateLimiter(
+            rate=self._get_rate_limit(),
+            burst=self._get_config("rate_burst", rate_burst),
+            adaptive=self._get_config("rate_limit") is None
+            )
+
+        self._circuit_breaker = _CircuitBreaker(
+            threshold=int(self._get_config("circuit_threshold", 5)),
+            reset=float(self._get_config("circuit_reset", 60.0))
+            )
+
+        self._latency = _LatencyTracker()
+        self._hedge_executor = None
 
 
     def has_credentials (self):
@@ -54,6 +814,34 @@ class _ScholInfra:
         return True
 
 
+    def _report_error (self, query):
+        """
+        report the error being handled within an API access method,
+        returning the message for its response -- which is distinct,
+        without a traceback, when the call failed fast because the
+        provider's circuit breaker is open
+        """
+        if isinstance(sys.exc_info()[1], _CircuitOpenError):
+            message = f"CIRCUIT OPEN: {query}"
+        else:
+            print(traceback.format_exc())
+            message = f"ERROR: {query}"
+
+        print(message)
+        return message
+
+
+    @classmethod
+    def _check_status (cls, response):
+        """
+        raise an error for an HTTP response which isn't a success, so
+        that an error left after retries, e.g., a 503, doesn't get
+        parsed as an empty result
+        """
+        if not 200 <= response.status_code < 300:
+            raise requests.HTTPError("HTTP {} for {}".format(response.status_code, getattr(response, "url", None)), response=response)
+
+
     @classmethod
     def _mark_elapsed_time (cls, t0):
         """
@@ -77,42 +865,783 @@ class _ScholInfra:
         return self.api_url.format(*args)
 
 
-    @classmethod
-    def _get_xml_node_value (cls, root, *name):
+    def _get_namespace (self):
+        """
+        lowercase identifier for this provider, used to prefix its
+        configuration parameters and name its cache
+        """
+        return self.name.lower().replace(" ", "_")
+
+
+    def _get_config (self, key, default=None):
+        """
+        return a parameter from the parent object's configuration,
+        where a provider-specific setting such as `openaire_xml_parser`
+        overrides the general setting `xml_parser`
+        """
+        if not self.parent:
+            return default
+
+        config = self.parent.config["DEFAULT"]
+        provider_key = "{}_{}".format(self._get_namespace(), key)
+
+        return config.get(provider_key, fallback=config.get(key, fallback=default))
+
+
+    def _get_config_flag (self, key, default=False):
+        """
+        return a boolean parameter from the parent object's configuration
+        """
+        value = self._get_config(key)
+
+        if value is None:
+            return default
+        else:
+            return configparser.ConfigParser.BOOLEAN_STATES.get(str(value).lower(), default)
+
+
+    def _get_rate_limit (self):
+        """
+        maximum number of requests per second for this provider, from
+        the `rate_limit` configuration parameter, otherwise the
+        provider's default; `None` means no limit
+        """
+        rate = self._get_config("rate_limit", self.rate_limit)
+
+        if rate:
+            return float(rate)
+        else:
+            return None
+
+
+    def _throttle (self):
+        """
+        wait until the provider's rate limit permits another request
+        """
+        self._rate_limiter.acquire()
+
+
+    @classmethod
+    def _is_transient_error (cls, error):
+        """
+        is an exception raised by a client library worth retrying, i.e.,
+        a connection failure, a timeout, or a 429 or 5xx response?
+        """
+        if isinstance(error, urllib.error.HTTPError):
+            return error.code in _RETRY_STATUS
+        elif isinstance(error, requests.HTTPError):
+            return error.response is not None and error.response.status_code in _RETRY_STATUS
+        elif isinstance(error, requests.RequestException):
+            return isinstance(error, (requests.ConnectionError, requests.Timeout))
+        else:
+            return isinstance(error, (OSError, http.client.HTTPException))
+
+
+    def _call_library (self, name, call, *args, ignore=()):
+        """
+        call a client library which makes its own HTTP requests, e.g.,
+        Entrez or dimcli, within the same deadline, circuit breaker,
+        rate limit, and retry policy as `_get()`; exceptions in
+        `ignore` mean that the provider responded, e.g., with a 404
+        """
+        breaker = self._circuit_breaker
+
+        if not breaker.allow():
+            raise _CircuitOpenError(f"{self.name}: {name}")
+
+        attempt = 0
+
+        try:
+            while True:
+                remaining = _time_remaining()
+
+                if remaining is not None and remaining <= 0.0:
+                    raise _DeadlineExceeded(self.name)
+
+                self._throttle()
+
+                try:
+                    result = call(*args)
+                    break
+                except ignore:
+                    raise
+                except Exception as e:
+                    if not self._is_transient_error(e):
+                        raise
+
+                    headers = getattr(e, "headers", None) or getattr(getattr(e, "response", None), "headers", None)
+                    delay = self._get_retry_delay(attempt, headers)
+
+                    if not self._can_retry(attempt, delay):
+                        raise
+
+                    reason = type(e).__name__
+
+                self._log_retry(name, attempt, delay, reason)
+                time.sleep(delay)
+                attempt += 1
+        except ignore:
+            breaker.record_success()
+            raise
+        except _DeadlineExceeded:
+            # the caller ran out of time, not the provider
+            breaker.release()
+            raise
+        except BaseException:
+            breaker.record_failure()
+            raise
+
+        breaker.record_success()
+        return result
+
+
+    def _get_cache_expire (self):
+        """
+        seconds until cached responses from this provider expire, from
+        the `cache_expire` configuration parameter, otherwise the
+        provider's default; -1 means never
+        """
+        return int(self._get_config("cache_expire", self.cache_expire))
+
+
+    def _get_result_cache (self):
+        """
+        the parent object's result cache, unless `cache` is disabled
+        """
+        if self.parent and self._get_config_flag("cache", True):
+            return self.parent._get_result_cache()
+        else:
+            return None
+
+
+    def _get_known_miss (self, method, query):
+        """
+        return an empty response if this query recently found no
+        match, otherwise `None`
+        """
+        cache = self._get_result_cache()
+
+        if cache:
+            t0 = time.time()
+            found, _ = cache.get(self._get_namespace(), json.dumps([ "miss", method, self._clean_title(query) ]))
+
+            if found:
+                timing = self._mark_elapsed_time(t0)
+                return self.response_class(self, None, timing, None)
+
+        return None
+
+
+    def _record_miss (self, method, query, response, urls=()):
+        """
+        remember a query which found no match, until the
+        `negative_cache_expire` number of seconds have passed;
+        the responses for its `urls` get evicted from the HTTP cache,
+        so that a miss expires after that TTL rather than `cache_expire`
+        """
+        if response.meta is not None or response.message:
+            return
+
+        self._forget_cached(urls)
+
+        cache = self._get_result_cache()
+        expire = int(self._get_config("negative_cache_expire", _NEGATIVE_CACHE_EXPIRE))
+
+        if cache and expire != 0:
+            cache.set(self._get_namespace(), json.dumps([ "miss", method, self._clean_title(query) ]), True, expire)
+
+
+    def _get_cached_result (self, method, args, compute, cacheable=None):
+        """
+        return the cached result for these arguments, otherwise call
+        `compute()` and cache its result for the `cache_expire` number
+        of seconds -- for API access through libraries such as Entrez
+        or dimcli, which bypass the HTTP cache;
+        results for which `cacheable(result)` is false don't get
+        cached, and neither do exceptions
+        """
+        cache = self._get_result_cache()
+
+        if not cache:
+            return compute()
+
+        namespace = self._get_namespace()
+        key = json.dumps([ method ] + list(args))
+        found, result = cache.get(namespace, key)
+
+        if not found:
+            result = compute()
+
+            if cacheable is None or cacheable(result):
+                cache.set(namespace, key, result, self._get_cache_expire())
+
+        return result
+
+
+    def _get_session (self):
+        """
+        lazily create the pooled HTTP session for this provider, so that
+        repeated calls reuse connections (and TLS handshakes) instead of
+        opening a new one per request; sized by the `pool_size`,
+        `pool_block`, and `keep_alive` configuration parameters
+
+        unless `cache` is disabled, this is a cached session, which has
+        its own namespace, e.g., `richcontext_crossref` for the
+        `sqlite` backend, and its own expiration -- rather than
+        patching `requests` for the whole process
+        """
+        with self._session_lock:
+            if not self._session:
+                adapter = HTTPAdapter(
+                    pool_connections=int(self._get_config("pool_connections", 10)),
+                    pool_maxsize=int(self._get_config("pool_size", 10)),
+                    pool_block=self._get_config_flag("pool_block", False)
+                    )
+
+                if self._get_config_flag("cache", True):
+                    session = requests_cache.CachedSession(
+                        cache_name="{}_{}".format(self._get_config("cache_name", "richcontext"), self._get_namespace()),
+                        backend=self._get_config("cache_backend", "sqlite"),
+                        expire_after=self._get_cache_expire()
+                        )
+                else:
+                    session = requests.Session()
+
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+
+                if not self._get_config_flag("keep_alive", True):
+                    session.headers["Connection"] = "close"
+
+                self._session = session
+
+        return self._session
+
+
+    def _get_max_retries (self):
+        """
+        how many times to retry a request after a transient error,
+        from the `max_retries` configuration parameter
+        """
+        return int(self._get_config("max_retries", 3))
+
+
+    def _get_retry_delay (self, attempt, headers=None):
+        """
+        seconds to wait before the given retry attempt: honor a
+        `Retry-After` response header if there is one, otherwise use
+        exponential backoff with full jitter, so that many clients
+        retrying at once don't all hit the provider together
+        """
+        max_backoff = float(self._get_config("retry_max_backoff", 60.0))
+        retry_after = (headers or {}).get("Retry-After")
+
+        if retry_after:
+            try:
+                delay = float(retry_after)
+            except ValueError:
+                try:
+                    delay = email.utils.parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    delay = None
+
+            if delay is not None:
+                return min(max(delay, 0.0), max_backoff)
+
+        backoff = float(self._get_config("retry_backoff", 0.5))
+        return random.uniform(0.0, min(max_backoff, backoff * 2 ** attempt))
+
+
+    def _log_retry (self, url, attempt, delay, reason):
+        """
+        report a request which is about to be retried
+        """
+        if self.parent and self.parent.logger:
+            self.parent.logger.debug("{}: retry {} in {:.3f} s after {} - {}".format(self.name, attempt + 1, delay, reason, url))
+
+
+    def _get_cached (self, url, **kwargs):
+        """
+        return the unexpired cached response for a URL, if there is one
+        """
+        session = self._get_session()
+
+        if isinstance(session, requests_cache.CachedSession):
+            response = session.get(url, only_if_cached=True, **kwargs)
+
+            # a cache miss returns `504 Not Cached`
+            if response.status_code != 504:
+                return response
+
+        return None
+
+
+    def _forget_cached (self, urls):
+        """
+        evict the cached responses for these URLs, if any
+        """
+        session = self._get_session()
+
+        if urls and isinstance(session, requests_cache.CachedSession):
+            session.cache.delete(urls=urls)
+
+
+    def _save_cached (self, url, response):
+        """
+        store a response which the async provider received in this
+        provider's HTTP cache, with the same expiration as if `_get()`
+        had fetched it
+        """
+        session = self._get_session()
+
+        if not isinstance(session, requests_cache.CachedSession):
+            return
+
+        if response.status_code not in session.settings.allowable_codes:
+            return
+
+        # the async client has already decoded the body
+        headers = requests.structures.CaseInsensitiveDict(response.headers)
+
+        for name in ("Content-Encoding", "Content-Length", "Transfer-Encoding"):
+            headers.pop(name, None)
+
+        cached = requests.Response()
+        cached.status_code = response.status_code
+        cached.headers = headers
+        cached.url = url
+        cached._content = response.content
+        cached.raw = urllib3.HTTPResponse(body=b"", headers=headers, status=response.status_code, preload_content=False, request_url=url)
+        cached.request = requests.Request("GET", url, headers=session.headers).prepare()
+
+        expires = requests_cache.get_expiration_datetime(session.settings.expire_after)
+        session.cache.save_response(cached, session.cache.create_key(cached.request), expires)
+
+
+    def _get (self, url, cache=True, **kwargs):
+        """
+        HTTP GET using this provider's pooled session, failing fast
+        while its circuit breaker is open; cached responses get returned
+        without waiting on the rate limit, retries, or hedging; with
+        `cache=False` the response neither comes from nor goes into
+        the HTTP cache
+        """
+        if cache:
+            urls = _REQUESTED_URLS.get()
+
+            if urls is not None:
+                urls.append(url)
+
+            response = self._get_cached(url, **kwargs)
+
+            if response is not None:
+                return response
+        else:
+            kwargs["headers"] = dict(kwargs.get("headers") or {}, **{ "Cache-Control": "no-store" })
+
+        breaker = self._circuit_breaker
+
+        if not breaker.allow():
+            raise _CircuitOpenError(f"{self.name}: {url}")
+
+        try:
+            response = self._get_hedged(url, **kwargs)
+        except _DeadlineExceeded:
+            # the caller ran out of time, not the provider
+            breaker.release()
+            raise
+        except BaseException:
+            breaker.record_failure()
+            raise
+
+        if response.status_code in _RETRY_STATUS:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+
+        return response
+
+
+    def _get_hedge_delay (self):
+        """
+        if hedging has been enabled with the `hedge` configuration
+        parameter, return the `hedge_percentile` of observed latency
+        (default 95) in seconds, once there are enough observations
+        """
+        if not self._get_config_flag("hedge", False):
+            return None
+        else:
+            return self._latency.percentile(float(self._get_config("hedge_percentile", 95)))
+
+
+    def _get_hedged (self, url, **kwargs):
+        """
+        hedged HTTP GET: if a request hasn't completed within the
+        hedge delay, fire a duplicate request then take whichever
+        response arrives first -- which cuts the tail latency for
+        providers that are occasionally very slow
+        """
+        delay = self._get_hedge_delay()
+
+        if delay is None:
+            return self._get_with_retry(url, **kwargs)
+
+        with self._session_lock:
+            if not self._hedge_executor:
+                self._hedge_executor = concurrent.futures.ThreadPoolExecutor(
+                    max_workers=2 * int(self._get_config("pool_size", 10))
+                    )
+
+            executor = self._hedge_executor
+
+        futures = [ executor.submit(contextvars.copy_context().run, self._get_with_retry, url, **kwargs) ]
+        done, _ = concurrent.futures.wait(futures, timeout=delay)
+
+        if not done:
+            if self.parent and self.parent.logger:
+                self.parent.logger.debug("{}: hedging after {:.3f} s - {}".format(self.name, delay, url))
+
+            futures.append(executor.submit(contextvars.copy_context().run, self._get_with_retry, url, **kwargs))
+
+        for i, future in enumerate(concurrent.futures.as_completed(futures)):
+            if future.exception() is None or i == len(futures) - 1:
+                break
+
+        for other in futures:
+            if other is not future:
+                # release the connection held by the slower response
+                other.add_done_callback(lambda f: f.exception() is None and f.result().close())
+
+        return future.result()
+
+
+    def _get_timeout (self):
+        """
+        `(connect, read)` timeouts in seconds for one HTTP request,
+        from the `connect_timeout` and `read_timeout` configuration
+        parameters, cut short by any deadline for the current call
+        """
+        connect = float(self._get_config("connect_timeout", 10.0))
+        read = float(self._get_config("read_timeout", 30.0))
+        remaining = _time_remaining()
+
+        if remaining is None:
+            return connect, read
+        elif remaining <= 0.0:
+            raise _DeadlineExceeded(self.name)
+        else:
+            return min(connect, remaining), min(read, remaining)
+
+
+    def _can_retry (self, attempt, delay):
+        """
+        is there another retry left in the budget, which can also wait
+        `delay` seconds within any deadline for the current call?
+        """
+        remaining = _time_remaining()
+
+        if attempt >= self._get_max_retries():
+            return False
+        else:
+            return remaining is None or delay < remaining
+
+
+    def _get_with_retry (self, url, **kwargs):
+        """
+        HTTP GET within the provider's rate limit and timeouts;
+        transient errors (connection failures, timeouts, 429 and 5xx
+        responses) get retried up to `max_retries` times
+        """
+        attempt = 0
+
+        while True:
+            self._throttle()
+
+            try:
+                t0 = time.monotonic()
+                response = self._get_session().get(url, timeout=self._get_timeout(), **kwargs)
+            except (requests.ConnectionError, requests.Timeout) as e:
+                delay = self._get_retry_delay(attempt)
+
+                if not self._can_retry(attempt, delay):
+                    raise
+
+                reason = type(e).__name__
+            else:
+                self._rate_limiter.update(response.headers)
+
+                if response.status_code not in _RETRY_STATUS:
+                    self._latency.add(time.monotonic() - t0)
+                    return response
+
+                delay = self._get_retry_delay(attempt, response.headers)
+
+                if not self._can_retry(attempt, delay):
+                    return response
+
+                reason = response.status_code
+                response.close()
+
+            self._log_retry(url, attempt, delay, reason)
+            time.sleep(delay)
+            attempt += 1
+
+
+    def _run_steps (self, steps):
+        """
+        drive the generator for an API access method, which yields the
+        URL for each HTTP GET request and gets sent back the response
+        -- so that `AsyncScholInfraAPI` can share the same generator,
+        making those requests with an async client instead
+        """
+        try:
+            url = next(steps)
+
+            while True:
+                try:
+                    response = self._get(url)
+                except Exception as e:
+                    url = steps.throw(e)
+                else:
+                    url = steps.send(response)
+        except StopIteration as e:
+            return e.value
+
+
+    def close (self):
+        """
+        release the pooled HTTP connections for this provider, and its
+        threads for hedged requests
+        """
+        with self._session_lock:
+            if self._session:
+                self._session.close()
+                self._session = None
+
+            if self._hedge_executor:
+                self._hedge_executor.shutdown(wait=False)
+                self._hedge_executor = None
+
+
+    def _parse_xml (self, text):
+        """
+        parse an XML API response, using either ElementTree (the
+        default, and much faster) or the BeautifulSoup `html.parser`
+        as selected by the `xml_parser` configuration parameter; also
+        fall back to BeautifulSoup for malformed XML
+        """
+        if self._get_config("xml_parser", "etree") != "html.parser":
+            try:
+                return ElementTree.fromstring(text)
+            except ElementTree.ParseError:
+                if self.parent and self.parent.logger:
+                    self.parent.logger.debug("malformed XML, falling back to html.parser")
+
+        return BeautifulSoup(text, "html.parser")
+
+
+    @classmethod
+    def _iterparse_xml (cls, source, *names):
+        """
+        incrementally parse an XML stream, yielding each node which
+        matches one of the given names as soon as its end tag has been
+        parsed, then discarding it -- so that peak memory scales with
+        the size of one node rather than the whole document; every
+        element which ends outside of a matching node gets detached
+        from its parent too, since matches are often nested inside
+        per-record wrapper elements
+        """
+        stack = []
+        matching = 0
+
+        for event, node in ElementTree.iterparse(source, events=("start", "end")):
+            if event == "start":
+                stack.append(node)
+
+                if any([ cls._xml_tag_matches(node.tag, name) for name in names ]):
+                    matching += 1
+
+                continue
+
+            stack.pop()
+
+            if any([ cls._xml_tag_matches(node.tag, name) for name in names ]):
+                matching -= 1
+                yield node
+                node.clear()
+
+            if matching == 0 and stack:
+                stack[-1].remove(node)
+
+
+    @classmethod
+    def _xml_tag_key (cls, tag):
+        """
+        the namespace URI and lowercase local name of an ElementTree
+        tag, memoized since a response only has a few distinct tags
+        """
+        key = _XML_TAG_KEYS.get(tag)
+
+        if key is None:
+            if not isinstance(tag, str):
+                # comments, processing instructions
+                key = (None, None)
+            else:
+                uri, _, local = tag.rpartition("}")
+                key = (uri[1:], local.lower())
+
+            _XML_TAG_KEYS[tag] = key
+
+        return key
+
+
+    @classmethod
+    def _xml_name_key (cls, name):
+        """
+        the namespace URI, or `None` for any namespace, and lowercase
+        local name for a name used by BeautifulSoup, e.g., `oaf:result`
+        """
+        prefix, _, local = name.rpartition(":")
+        return (_XML_NAMESPACES[prefix] if prefix else None), local.lower()
+
+
+    @classmethod
+    def _xml_tag_matches (cls, tag, name):
+        """
+        does an ElementTree tag match the name used by BeautifulSoup,
+        e.g., `{http://namespace.openaire.eu/oaf}result` for `oaf:result`
+        """
+        tag_uri, tag_local = cls._xml_tag_key(tag)
+        uri, local = cls._xml_name_key(name)
+
+        return tag_local == local and (uri is None or tag_uri == uri)
+
+
+    @classmethod
+    def _is_xml_node (cls, node, name):
+        """
+        is this XML node, from either parser backend, of the named type?
+        """
+        if isinstance(node, ElementTree.Element):
+            return cls._xml_tag_matches(node.tag, name)
+        else:
+            return node.name == name
+
+
+    @classmethod
+    def _iter_xml_nodes (cls, root, name, attrs=None):
+        """
+        generate the named descendants of an ElementTree node in
+        document order, lazily so that a lookup can stop at the first
+        match; like BeautifulSoup's `find_all()`, the node itself
+        doesn't count
+        """
+        uri, local = cls._xml_name_key(name)
+        nodes = root.iter()
+        next(nodes)
+
+        # the tag matching gets inlined, since this loop is the hot path
+        # for extracting fields from a response
+        for node in nodes:
+            tag_uri, tag_local = _XML_TAG_KEYS.get(node.tag) or cls._xml_tag_key(node.tag)
+
+            if tag_local == local and (uri is None or tag_uri == uri):
+                if not attrs or all([ node.get(k) == v for k, v in attrs.items() ]):
+                    yield node
+
+
+    @classmethod
+    def _find_xml_nodes (cls, root, name, attrs=None):
+        """
+        return all the named descendants of an XML node, from either
+        parser backend
+        """
+        if isinstance(root, ElementTree.Element):
+            return list(cls._iter_xml_nodes(root, name, attrs))
+        elif attrs:
+            return root.find_all(name, attrs)
+        else:
+            return root.find_all(name)
+
+
+    @classmethod
+    def _get_xml_text (cls, node):
+        """
+        return all of the text within an XML node, from either parser
+        backend
+        """
+        if isinstance(node, ElementTree.Element):
+            return "".join(node.itertext())
+        else:
+            return node.text
+
+
+    @classmethod
+    def _get_xml_node_value (cls, root, *name):
         """
         return the named value from an XML node, if it exists
         """
-        if len(name) == 1:
+        if isinstance(root, ElementTree.Element):
+            node = next(cls._iter_xml_nodes(root, *name), None)
+        elif len(name) == 1:
             node = root.find(name[0])
         elif len(name) == 2:
             node = root.find(name[0], name[1])
 
-        if not node:
-            return None
-        elif len(node.text) < 1:
+        text = cls._get_xml_text(node) if node is not None else None
+
+        if not text:
             return None
         else:
-            return node.text.strip()
+            return text.strip()
+
+
+    @classmethod
+    def _xml_to_dict (cls, xml, **kwargs):
+        """
+        convert XML directly into plain dicts and lists -- the same
+        structure which a `json.loads(json.dumps(xmltodict.parse(xml)))`
+        round trip would produce, without the extra serialization
+        """
+        return xmltodict.parse(xml, dict_constructor=dict, **kwargs)
 
 
     @classmethod
     def _clean_title (cls, title):
         """
-        minimal set of string transformations so that a title can be
-        compared consistently across API providers
+        string transformations so that a title can be compared
+        consistently across API providers, regardless of diacritics,
+        typographic dashes and quotes, or HTML entities; `title` may
+        also be a `TitleKey`, which has been normalized already
         """
-        return re.sub("\s+", " ", title.strip(" \"'?!.,")).lower()
+        if isinstance(title, TitleKey):
+            return title.key
+        else:
+            return _normalize_title(title)
+
+
+    @classmethod
+    def title_match (cls, title0, title1):
+        """
+        within reason, do the two titles match?
+        """
+        if not title0 or not title1:
+            return False
+        else:
+            return cls._clean_title(title0) == cls._clean_title(title1)
 
 
     @classmethod
-    def title_match (cls, title0, title1):
+    def title_similarity (cls, title0, title1, threshold=0.0):
         """
-        within reason, do the two titles match?
+        how closely do the two titles match, from 0.0 to 1.0? this is
+        a normalized Levenshtein similarity, which returns 0.0 early
+        once it falls below `threshold`
         """
         if not title0 or not title1:
-            return False
+            return 0.0
         else:
-            return cls._clean_title(title0) == cls._clean_title(title1)
+            return _levenshtein_ratio(cls._clean_title(title0), cls._clean_title(title1), threshold)
 
 
     def full_text_search (self, search_term, limit=None, exact_match=True):
@@ -143,6 +1672,46 @@ class _ScholInfra:
         return [_ScholInfraResponse(self, meta, timing, message)]
 
 
+    @classmethod
+    def _limit_reached (cls, count, limit):
+        """
+        has a paged search already returned `limit` results? a missing
+        or non-positive limit means no limit
+        """
+        return bool(limit) and limit > 0 and count >= limit
+
+
+    def iter_full_text_search (self, search_term, limit=None, exact_match=True, page_size=100):
+        """
+        Perform a full-text search for publications, paging through
+        the results of one of the discovery services and yielding
+        each one as soon as its page arrives, so that large result
+        sets get processed with constant memory. Providers which
+        cannot page fall back to `full_text_search()`.
+
+        :param search_term: Query terms for full-text search of publications.
+        :type search_term: str.
+
+        :param limit: Maximum number of search responses to return.
+        :type limit: int.
+
+        :param exact_match: Some APIs allow a flag to turn off exact matches.
+        :type limit: bool.
+
+        :param page_size: Number of search results to request per API call.
+        :type page_size: int.
+
+        :returns: generator of _ScholInfraResponse(meta, timing, message)
+            - meta - publication JSON text from search results.
+            - timing - elasped system time in milliseconds.
+            - message - an optional error message, in which case it
+              is the last response generated.
+        """
+        for response in self.full_text_search(search_term, limit=limit, exact_match=exact_match):
+            if response.meta or response.message:
+                yield response
+
+
     def title_search (self, title):
         """
         Attempt to locate metadata for a publication based on its
@@ -218,10 +1787,18 @@ class _ScholInfra_EuropePMC (_ScholInfra):
     https://europepmc.org/RestfulWebService
     """
 
+    @_negative_cache
     def title_search (self, title):
         """
         parse metadata from XML returned from the EuropePMC API query
         """
+        return self._run_steps(self._title_search_steps(title))
+
+
+    def _title_search_steps (self, title):
+        """
+        generator for the API requests of `title_search()`
+        """
         meta = None
         timing = 0.0
         message = None
@@ -229,20 +1806,24 @@ class _ScholInfra_EuropePMC (_ScholInfra):
         try:
             t0 = time.time()
             url = self._get_api_url(urllib.parse.quote(title))
-            response = requests.get(url).text
-            soup = BeautifulSoup(response, "html.parser")
+            response = yield url
+            self._check_status(response)
+
+            response = response.text
+            root = self._parse_xml(response)
 
             if self.parent.logger:
-                self.parent.logger.debug(soup.prettify())
+                self.parent.logger.debug(response)
 
             meta = OrderedDict()
-            result_list = soup.find_all("result")
+            title_key = TitleKey(title)
+            result_list = self._find_xml_nodes(root, "result")
             for result in result_list:
                 if self.parent.logger:
                     self.parent.logger.debug(result)
                 result_title = self._get_xml_node_value(result, "title")
 
-                if self.title_match(title, result_title):
+                if self.title_match(title_key, result_title):
                     val = self._get_xml_node_value(result, "doi")
 
                     if val:
@@ -283,11 +1864,9 @@ class _ScholInfra_EuropePMC (_ScholInfra):
             if len(meta) < 1:
                 meta = None
 
-        except:
-            print(traceback.format_exc())
+        except Exception:
             meta = None
-            message = f"ERROR: {title}"
-            print(message)
+            message = self._report_error(title)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_EuropePMC(self, meta, timing, message)
@@ -298,91 +1877,180 @@ class _ScholInfra_OpenAIRE (_ScholInfra):
     https://develop.openaire.eu/
     """
 
+    def _parse_result (self, result):
+        """
+        extract the metadata from one `oaf:result` XML node
+        """
+        meta = OrderedDict()
+
+        val = self._get_xml_node_value(result, "pid", {"classname": "doi"})
+        if val:
+            meta["doi"] = val
+
+        val  = self._get_xml_node_value(result, "title")
+        if val:
+            meta["title"] = val
+
+        val = self._get_xml_node_value(result, "url")
+        if val:
+            meta["url"] = val
+
+        val = self._get_xml_node_value(result, "dateofacceptance")
+        if val:
+            meta["dateofacceptance"] = val
+
+        val = [self._get_xml_text(a) for a in self._find_xml_nodes(result, "creator")]
+        if val:
+            meta["authors"] = val
+
+        val = self._get_xml_node_value(result, "journal")
+        if val:
+            meta['journal'] = val
+
+        val = self._get_xml_node_value(result, "issn")
+        if val:
+            meta['issn'] = val
+
+        meta["open"] = len(self._find_xml_nodes(result, "bestaccessright", {"classid": "OPEN"})) > 0
+        return meta
+
+
+    def _iter_results (self, search_url):
+        """
+        generate the `total` node and then each `oaf:result` node from
+        an OpenAIRE API query -- parsed incrementally from the response
+        stream, unless the `html.parser` backend has been selected
+        """
+        if self._get_config("xml_parser", "etree") == "html.parser":
+            root = self._parse_xml(self._get(search_url).text)
+            yield from self._find_xml_nodes(root, "total")
+            yield from self._find_xml_nodes(root, "oaf:result")
+        else:
+            response = self._get_cached(search_url)
+
+            if response is not None:
+                source = io.BytesIO(response.content)
+            else:
+                # stream past the HTTP cache, which would otherwise read
+                # the whole response into memory before parsing it
+                response = self._get(search_url, stream=True, cache=False)
+                response.raw.decode_content = True
+                source = response.raw
+
+            try:
+                yield from self._iterparse_xml(source, "total", "oaf:result")
+            finally:
+                response.close()
+
+
+    @_negative_cache
     def title_search (self, title):
         """
         parse metadata from XML returned from the OpenAIRE API query
         """
+        return self._run_steps(self._title_search_steps(title))
+
+
+    def _title_search_steps (self, title):
+        """
+        generator for the API requests of `title_search()`
+        """
         meta = None
         timing = 0.0
         message = None
 
         t0 = time.time()
-        url = self._get_api_url() + "title={}".format(urllib.parse.quote(title))
-        response = requests.get(url).text
-        soup = BeautifulSoup(response, "html.parser")
 
-        if self.parent.logger:
-            self.parent.logger.debug(soup.prettify())
-
-        meta = OrderedDict()
-
-        for result in soup.find_all("oaf:result"):
-            result_title = self._get_xml_node_value(result, "title")
-
-            if self.title_match(title, result_title):
-                val = self._get_xml_node_value(result, "pid", {"classname": "doi"})
-                if val:
-                    meta["doi"] = val
-                
-                val  = self._get_xml_node_value(result, "title")
-                if val:
-                    meta["title"] = val
+        try:
+            url = self._get_api_url() + "title={}".format(urllib.parse.quote(title))
+            response = yield url
+            self._check_status(response)
 
-                val = self._get_xml_node_value(result, "url")
-                if val:
-                    meta["url"] = val
+            response = response.text
+            root = self._parse_xml(response)
 
-                val = self._get_xml_node_value(result, "dateofacceptance")
-                if val:
-                    meta["dateofacceptance"] = val
-                
-                val = [a.text for a in result.find_all("creator")]
-                if val:
-                    meta["authors"] = val
+            if self.parent.logger:
+                self.parent.logger.debug(response)
 
-                val = self._get_xml_node_value(result, "journal")
-                if val:
-                    meta['journal'] = val
+            title_key = TitleKey(title)
 
-                val = self._get_xml_node_value(result, "issn")
-                if val:
-                    meta['issn'] = val
+            for result in self._find_xml_nodes(root, "oaf:result"):
+                result_title = self._get_xml_node_value(result, "title")
 
-                meta["open"] = len(result.find_all("bestaccessright", {"classid": "OPEN"})) > 0
+                if self.title_match(title_key, result_title):
+                    meta = self._parse_result(result)
+                    break
+        except Exception:
+            meta = None
+            message = self._report_error(title)
 
-                timing = self._mark_elapsed_time(t0)
-                return _ScholInfraResponse_OpenAIRE(self, meta, timing, message)
-        
         timing = self._mark_elapsed_time(t0)
-        return _ScholInfraResponse_OpenAIRE(self, None, timing, message)
+        return _ScholInfraResponse_OpenAIRE(self, meta, timing, message)
 
 
     def full_text_search (self, search_term, limit=None, exact_match=None):
         """
-        parse metadata from XML returned from the OpenAIRE API query
+        parse metadata from XML returned from the OpenAIRE API query,
+        paging through the results -- the first page also reports the
+        total, so there's no separate request to count them first
         """
         meta = None
         timing = 0.0
         message = None
 
         t0 = time.time()
-        base_url = self._get_api_url() + "keywords={}".format(urllib.parse.quote(search_term))
-        
-        if limit:
-            search_url = base_url + "&size={}".format(limit)
+
+        if limit and limit > 0:
+            page_size = min(limit, 1000)
         else:
-            response = requests.get(base_url).text
-            soup = BeautifulSoup(response, "html.parser")
-            limit_response = int(soup.find("total").text)
-            search_url = base_url + "&size={}".format(limit_response)
-        
-        response = requests.get(search_url).text
-        soup = BeautifulSoup(response, "html.parser")
-        meta = soup.find_all("oaf:result")
+            page_size = 1000
+
+        responses = list(self.iter_full_text_search(search_term, limit=limit, page_size=page_size))
 
         timing = self._mark_elapsed_time(t0)
-        return [_ScholInfraResponse_OpenAIRE(self, data, timing, message) for data in meta] if meta else [_ScholInfraResponse_OpenAIRE(self, meta, timing, message)]
-    
+        return responses if responses else [_ScholInfraResponse_OpenAIRE(self, meta, timing, message)]
+
+
+    def iter_full_text_search (self, search_term, limit=None, exact_match=None, page_size=100):
+        """
+        page through the results of an OpenAIRE API query
+        """
+        message = None
+        t0 = time.time()
+        base_url = self._get_api_url() + "keywords={}".format(urllib.parse.quote(search_term))
+        count = 0
+        page = 1
+
+        try:
+            while True:
+                search_url = base_url + "&page={}&size={}".format(page, page_size)
+                total = 0
+                page_count = 0
+
+                for result in self._iter_results(search_url):
+                    if self._is_xml_node(result, "total"):
+                        total = int(self._get_xml_text(result))
+                        continue
+
+                    data = self._parse_result(result)
+                    timing = self._mark_elapsed_time(t0)
+                    yield _ScholInfraResponse_OpenAIRE(self, data, timing, message)
+                    count += 1
+                    page_count += 1
+
+                    if self._limit_reached(count, limit):
+                        return
+
+                if page_count < 1 or page * page_size >= total:
+                    return
+
+                page += 1
+        except Exception:
+            message = self._report_error(search_term)
+
+            timing = self._mark_elapsed_time(t0)
+            yield _ScholInfraResponse_OpenAIRE(self, None, timing, message)
+
 
 class _ScholInfra_SemanticScholar (_ScholInfra):
     """
@@ -393,21 +2061,34 @@ class _ScholInfra_SemanticScholar (_ScholInfra):
         """
         parse metadata returned from a Semantic Scholar API query
         """
+        return self._run_steps(self._publication_lookup_steps(identifier))
+
+
+    def _publication_lookup_steps (self, identifier):
+        """
+        generator for the API requests of `publication_lookup()`
+        """
         meta = None
         timing = 0.0
         message = None
 
         t0 = time.time()
-        url = self._get_api_url(identifier)
-        response = requests.get(url)
-        if response.status_code == requests.codes.ok:
-            meta = json.loads(response.text)
 
-        if not meta or len(meta) < 1 or "error" in meta:
-            meta = None
-        elif "message" in meta:
-            message = meta["message"]
+        try:
+            url = self._get_api_url(identifier)
+            response = yield url
+            if response.status_code == requests.codes.ok:
+                meta = json.loads(response.text)
+
+            if not meta or len(meta) < 1 or "error" in meta:
+                meta = None
+            elif "message" in meta:
+                message = meta["message"]
+                meta = None
+
+        except Exception:
             meta = None
+            message = self._report_error(identifier)
             
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_SemanticScholar(self, meta, timing, message)
@@ -422,18 +2103,30 @@ class _ScholInfra_Unpaywall (_ScholInfra):
         """
         construct a URL to query the API for Unpaywall
         """
+        return self._run_steps(self._publication_lookup_steps(identifier))
+
+
+    def _publication_lookup_steps (self, identifier):
+        """
+        generator for the API requests of `publication_lookup()`
+        """
         meta = None
         timing = 0.0
         message = None
 
         t0 = time.time()
-        email = self.parent.config["DEFAULT"]["email"]
 
-        url = self._get_api_url(identifier, email)
-        meta = json.loads(requests.get(url).text)
+        try:
+            email = self.parent.config["DEFAULT"]["email"]
+            url = self._get_api_url(identifier, email)
+            meta = json.loads((yield url).text)
+
+            if not meta or len(meta) < 1 or "error" in meta:
+                meta = None
 
-        if not meta or len(meta) < 1 or "error" in meta:
+        except Exception:
             meta = None
+            message = self._report_error(identifier)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_Unpaywall(self, meta, timing, message)
@@ -448,6 +2141,13 @@ class _ScholInfra_dissemin (_ScholInfra):
         """
         parse metadata returned from a dissemin API query
         """
+        return self._run_steps(self._publication_lookup_steps(identifier))
+
+
+    def _publication_lookup_steps (self, identifier):
+        """
+        generator for the API requests of `publication_lookup()`
+        """
         meta = None
         timing = 0.0
         message = None
@@ -455,18 +2155,16 @@ class _ScholInfra_dissemin (_ScholInfra):
         try:
             t0 = time.time()
             url = self._get_api_url(identifier)
-            response = requests.get(url)
+            response = yield url
             if response.status_code == requests.codes.ok:
                 meta = json.loads(response.text)
 
             if not meta or len(meta) < 1 or "error" in meta:
                 meta = None
 
-        except:
-            print(traceback.format_exc())
+        except Exception:
             meta = None
-            message = f"ERROR: {identifier}"
-            print(message)
+            message = self._report_error(identifier)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_dissemin(self, meta, timing, message)
@@ -523,12 +2221,35 @@ class _ScholInfra_Dimensions (_ScholInfra):
 
     def _run_query (self, query):
         """
-        run one Dimensions API query, and first login if needed
+        run one Dimensions API query, and first login if needed --
+        unless the query's JSON result has been cached, although a
+        result without publications doesn't get cached; raises an
+        error, rather than returning an empty result, when the API
+        reports errors
         """
-        self._login()
-        return self.api_obj.query(query)
+        def run_query ():
+            self._login()
+            return self.api_obj.query(query)
+
+        def compute ():
+            response = self._call_library("query", run_query)
 
+            if not isinstance(response, dimcli.DslDataset):
+                raise ValueError("{}: unexpected response for query {}".format(self.name, query))
+            elif "errors" in response.json:
+                raise ValueError("{}: {} for query {}".format(self.name, response.json["errors"], query))
 
+            return response.json
+
+        return dimcli.DslDataset(self._get_cached_result(
+            "query",
+            [ query ],
+            compute,
+            lambda result: len(result.get("publications", [])) > 0
+            ))
+
+
+    @_negative_cache
     def title_search (self, title):
         """
         parse metadata from a Dimensions API query
@@ -541,23 +2262,43 @@ class _ScholInfra_Dimensions (_ScholInfra):
         enc_title = self._clean_search_phrase(title)
         query = 'search publications in title_only for "\\"{}\\"" return publications[all]'.format(enc_title)
 
-        self._login()
-        response = self._run_query(query)
+        try:
+            response = self._run_query(query)
+
+            if hasattr(response, "publications"):
+                title_key = TitleKey(title)
 
-        if hasattr(response, "publications"):
-            for meta in response.publications:
-                result_title = meta["title"]
+                for result in response.publications:
+                    result_title = result["title"]
 
-                if self.title_match(title, result_title):
-                    if self.parent.logger:
-                        self.parent.logger.debug(meta)
+                    if self.title_match(title_key, result_title):
+                        if self.parent.logger:
+                            self.parent.logger.debug(result)
+
+                        if len(result) > 0:
+                            meta = result
+                            break
+        except Exception:
+            meta = None
+            message = self._report_error(title)
 
-                    if len(meta) > 0:
-                        timing = self._mark_elapsed_time(t0)
-                        return _ScholInfraResponse_Dimensions(self, meta, timing, message)
-        
         timing = self._mark_elapsed_time(t0)
-        return _ScholInfraResponse_Dimensions(self, None, timing, message)
+        return _ScholInfraResponse_Dimensions(self, meta, timing, message)
+
+
+    def _full_text_query (self, search_term, exact_match, limit, skip=0):
+        """
+        construct a Dimensions DSL query for full-text search
+        """
+        if exact_match == False:
+            query = 'search publications in full_data_exact for "{}" return publications[all] limit {}'.format(search_term, limit)
+        else:
+            query = 'search publications in full_data_exact for "\\"{}\\"" return publications[all] limit {}'.format(search_term, limit)
+
+        if skip > 0:
+            query += " skip {}".format(skip)
+
+        return query
 
 
     def full_text_search (self, search_term, limit=None, exact_match=True):
@@ -569,25 +2310,49 @@ class _ScholInfra_Dimensions (_ScholInfra):
         message = None
 
         t0 = time.time()
+        query = self._full_text_query(search_term, exact_match, limit or 1000)
 
-        if not limit:
-            query = 'search publications in full_data_exact for "\\"{}\\"" return publications[all] limit 1000'.format(search_term)
+        try:
+            response = self._run_query(query)
+            meta = response.publications
+        except Exception:
+            meta = None
+            message = self._report_error(search_term)
+
+        timing = self._mark_elapsed_time(t0)
+        return [_ScholInfraResponse_Dimensions(self, data, timing, message) for data in meta] if meta else [_ScholInfraResponse_Dimensions(self, meta, timing, message)]
 
-            if exact_match == False:
-                query = 'search publications in full_data_exact for "{}" return publications[all] limit 1000'.format(search_term)
 
-        else:
-            query = 'search publications in full_data_exact for "\\"{}\\"" return publications[all] limit {}'.format(search_term,limit)
+    def iter_full_text_search (self, search_term, limit=None, exact_match=True, page_size=1000):
+        """
+        page through the results of a Dimensions API full-text search
+        using `limit`/`skip`
+        """
+        message = None
+        t0 = time.time()
+        count = 0
 
-            if exact_match == False:
-                query = 'search publications in full_data_exact for "{}" return publications[all] limit {}'.format(search_term,limit)
+        try:
+            while True:
+                query = self._full_text_query(search_term, exact_match, page_size, skip=count)
+                response = self._run_query(query)
+                meta = response.publications or []
+                timing = self._mark_elapsed_time(t0)
 
-        self._login()
-        response = self._run_query(query)
-        meta = response.publications
-        
-        timing = self._mark_elapsed_time(t0)
-        return [_ScholInfraResponse_Dimensions(self, data, timing, message) for data in meta] if meta else [_ScholInfraResponse_Dimensions(self, meta, timing, message)]
+                for data in meta:
+                    yield _ScholInfraResponse_Dimensions(self, data, timing, message)
+                    count += 1
+
+                    if self._limit_reached(count, limit):
+                        return
+
+                if len(meta) < page_size:
+                    return
+        except Exception:
+            message = self._report_error(search_term)
+
+            timing = self._mark_elapsed_time(t0)
+            yield _ScholInfraResponse_Dimensions(self, None, timing, message)
 
 
 class _ScholInfra_RePEc (_ScholInfra):
@@ -618,24 +2383,29 @@ class _ScholInfra_RePEc (_ScholInfra):
         message = None
 
         t0 = time.time()
-        url = self._get_cgi_url(title)
-        response = requests.get(url).text
-        soup = BeautifulSoup(response, "html.parser")
 
-        if self.parent.logger:
-            self.parent.logger.debug(soup.prettify())
+        try:
+            url = self._get_cgi_url(title)
+            response = self._get(url).text
+            soup = BeautifulSoup(response, "html.parser")
 
-        ol = soup.find("ol", {"class": "list-group"})
-        results = ol.findChildren()
+            if self.parent.logger:
+                self.parent.logger.debug(soup.prettify())
 
-        if len(results) > 0:
-            li = results[0]
+            ol = soup.find("ol", {"class": "list-group"})
+            results = ol.findChildren()
 
-            if self.parent.logger:
-                self.parent.logger.debug(li)
+            if len(results) > 0:
+                li = results[0]
 
-            # TODO: can we perform a title search here?
-            meta = li.find("i").get_text()
+                if self.parent.logger:
+                    self.parent.logger.debug(li)
+
+                # TODO: can we perform a title search here?
+                meta = li.find("i").get_text()
+        except Exception:
+            meta = None
+            message = self._report_error(title)
 
         timing = self._mark_elapsed_time(t0)
         return meta, timing, message
@@ -653,17 +2423,15 @@ class _ScholInfra_RePEc (_ScholInfra):
             t0 = time.time()
             token = self.parent.config["DEFAULT"]["repec_token"]
             url = self._get_api_url(token, handle)
-            meta = json.loads(requests.get(url).text)
+            meta = json.loads(self._get(url).text)
 
             if not meta or len(meta) < 1:
                 meta = None
             if meta == [{'error': 2}]:
                 raise Exception('Issue when fetching metadata: ', meta)
         except:
-            print(traceback.format_exc())
             meta = None
-            message = f"ERROR: {handle}"
-            print(message)
+            message = self._report_error(handle)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_RePEc(self, meta, timing, message)
@@ -678,7 +2446,7 @@ class _ScholInfra_SSRN (_ScholInfra):
         """
         extract the structured metadata from a rendered URL
         """
-        response = requests.get(url).text
+        response = self._get(url).text
         soup = BeautifulSoup(response, "html.parser")
 
         if self.parent.logger:
@@ -715,7 +2483,12 @@ class _ScholInfra_SSRN (_ScholInfra):
         url = self._get_api_url(identifier)
 
         if "ssrn" in url:    
-            meta = self._lookup_url(url)
+            try:
+                meta = self._lookup_url(url)
+            except Exception:
+                meta = None
+                message = self._report_error(identifier)
+
             timing = self._mark_elapsed_time(t0)
 
             if not meta or len(meta) < 1:
@@ -724,6 +2497,37 @@ class _ScholInfra_SSRN (_ScholInfra):
         return _ScholInfraResponse_SSRN(self, meta, timing, message)
 
 
+    def _search_url (self, title):
+        """
+        use a headless browser to run the SSRN search form, returning
+        the URL of the first result, or `None` if there isn't one
+        """
+        ssrn_homepage = "https://www.ssrn.com/index.cfm/en/"
+
+        with self.parent._get_browser_pool().browser() as browser:
+            browser.get(ssrn_homepage)
+
+            class_name = "form-control"
+            search = browser.find_element_by_class_name(class_name)
+
+            search.send_keys(title)
+            search.send_keys(Keys.RETURN)
+
+            search_url = browser.current_url
+            search_url_result = browser.get(search_url)
+
+            # a search which finds nothing has no result elements
+            result_elements = browser.find_elements_by_xpath("//*[@class='title optClickTitle']")
+
+            if len(result_elements) < 1:
+                return None
+
+            url = result_elements[0].get_attribute("href")
+
+        return url
+
+
+    @_negative_cache
     def title_search (self, title):
         """
         title search for SSRN
@@ -733,30 +2537,22 @@ class _ScholInfra_SSRN (_ScholInfra):
         message = None
 
         t0 = time.time()
-        ssrn_homepage = "https://www.ssrn.com/index.cfm/en/"
 
-        chrome_path = self.parent.config["DEFAULT"]["chrome_exe_path"]
-        chrome_options = Options()  
-        chrome_options.add_argument("--headless")  
-
-        browser = webdriver.Chrome(executable_path=chrome_path, options=chrome_options)
-        browser.get(ssrn_homepage)
-
-        class_name = "form-control"
-        search = browser.find_element_by_class_name(class_name)
-
-        search.send_keys(title)
-        search.send_keys(Keys.RETURN)
-
-        search_url = browser.current_url
-        search_url_result = browser.get(search_url)
-
-        # TODO: Fix Exception thrown when element not found
-        result_element = browser.find_element_by_xpath("//*[@class='title optClickTitle']")
-        url = result_element.get_attribute("href")
-        browser.quit()
+        try:
+            # the browser search is slow, so cache the URL it finds --
+            # but not a miss, which only the negative cache remembers
+            url = self._get_cached_result(
+                "search_url",
+                [ self._clean_title(title) ],
+                lambda: self._search_url(title),
+                lambda url: url is not None
+                )
 
-        meta = self._lookup_url(url)
+            if url:
+                meta = self._lookup_url(url)
+        except Exception:
+            meta = None
+            message = self._report_error(title)
 
         if not meta or len(meta) < 1:
             meta = None
@@ -771,28 +2567,111 @@ class _ScholInfra_Crossref (_ScholInfra):
         """
         parse metadata returned from Crossref API given a DOI
         """
+        return self._run_steps(self._publication_lookup_steps(identifier))
+
+
+    def _publication_lookup_steps (self, identifier):
+        """
+        generator for the API requests of `publication_lookup()`, which
+        requests `works/{doi}` from the REST API directly
+        """
         meta = None
         timing = 0.0
         message = None
         t0 = time.time()
-        try: 
-            meta = crossref_commons.retrieval.get_publication_as_json(identifier)
+
+        try:
+            url = "{}/{}".format(self.api_url.partition("?")[0], urllib.parse.quote(identifier.strip(), safe="/"))
+            response = yield url
+
+            # a 404 means that Crossref doesn't have this DOI
+            if response.status_code != 404:
+                self._check_status(response)
+                meta = json.loads(response.text).get("message")
+
             if not meta or len(meta) < 1:
                 meta = None
-        except:
-            print(traceback.format_exc())
+        except Exception:
             meta = None
-            message = f"ERROR: {identifier}"
-            print(message)  
+            message = self._report_error(identifier)
     
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_Crossref(self, meta, timing, message)
 
 
+    def _lookup_batch (self, identifiers):
+        """
+        pack several DOIs into one `filter=doi:...` query, then split
+        the returned items back out per DOI
+        """
+        if len(identifiers) < 1:
+            return []
+
+        meta = {}
+        message = None
+        t0 = time.time()
+
+        try:
+            doi_filter = ",".join([ "doi:" + urllib.parse.quote(doi, safe="/") for doi in identifiers ])
+            query = "filter={}&rows={}".format(doi_filter, len(identifiers))
+            url = self._get_api_url(query)
+
+            response = self._get(url).text
+            json_response = json.loads(response)
+
+            for item in json_response["message"]["items"]:
+                meta[item["DOI"].lower()] = item
+        except:
+            message = self._report_error(', '.join(identifiers))
+
+        timing = self._mark_elapsed_time(t0)
+        return [
+            _ScholInfraResponse_Crossref(self, meta.get(doi.lower()), timing, message)
+            for doi in identifiers
+            ]
+
+
+    def publication_lookup_batch (self, identifiers, batch_size=50):
+        """
+        parse metadata returned from Crossref API given a list of DOIs,
+        using one API request per `batch_size` DOIs rather than one per
+        DOI; responses are returned in the same order as the DOIs, with
+        `meta` set to `None` for each DOI that Crossref did not find
+        """
+        responses = []
+        batch = []
+
+        for doi in identifiers:
+            if "," in doi:
+                # commas would split the filter value, so look these up singly
+                responses.extend(self._lookup_batch(batch))
+                responses.append(self.publication_lookup(doi))
+                batch = []
+            else:
+                batch.append(doi)
+
+                if len(batch) >= batch_size:
+                    responses.extend(self._lookup_batch(batch))
+                    batch = []
+
+        if len(batch) > 0:
+            responses.extend(self._lookup_batch(batch))
+
+        return responses
+
+
+    @_negative_cache
     def title_search (self, title):
         """
         parse metadata returned from Crossref API given a title
         """
+        return self._run_steps(self._title_search_steps(title))
+
+
+    def _title_search_steps (self, title):
+        """
+        generator for the API requests of `title_search()`
+        """
         meta = None
         timing = 0.0
         message = None
@@ -801,8 +2680,10 @@ class _ScholInfra_Crossref (_ScholInfra):
             query = "query.bibliographic={}".format(urllib.parse.quote(title))
             url = self._get_api_url(query)
 
-            response = requests.get(url).text
-            json_response = json.loads(response)
+            response = yield url
+            self._check_status(response)
+
+            json_response = json.loads(response.text)
 
             items = json_response["message"]["items"]
             first_item = items[0] if len(items) > 0 else {}
@@ -849,11 +2730,9 @@ class _ScholInfra_Crossref (_ScholInfra):
                 # meta = raw_meta
                 if self.parent.logger:
                     self.parent.logger.debug(meta)
-        except: 
-            print(traceback.format_exc())
+        except Exception: 
             meta = None
-            message = f"ERROR: {title}"
-            print(message)    
+            message = self._report_error(title)
          
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_Crossref(self, meta, timing, message)
@@ -866,6 +2745,13 @@ class _ScholInfra_Crossref (_ScholInfra):
         for multiple terms within strings.
         See https://github.com/CrossRef/rest-api-doc/issues/143
         """
+        return self._run_steps(self._full_text_search_steps(search_term, limit=limit, exact_match=exact_match))
+
+
+    def _full_text_search_steps (self, search_term, limit=None, exact_match=None):
+        """
+        generator for the API requests of `full_text_search()`
+        """
         meta = None
         timing = 0.0
         message = None
@@ -878,32 +2764,94 @@ class _ScholInfra_Crossref (_ScholInfra):
             query = "query=%22{}%22/type/journal-article&rows={}".format(urllib.parse.quote(search_term), limit)
             url = self._get_api_url(query)
 
-            response = requests.get(url).text
+            response = (yield url).text
             json_response = json.loads(response)
             meta = json_response["message"].get('items')
-        except: 
-            print(traceback.format_exc())
+        except Exception: 
             meta = None
-            message = f"ERROR: {search_term}"
-            print(message)    
+            message = self._report_error(search_term)
 
         timing = self._mark_elapsed_time(t0)
         return [_ScholInfraResponse_Crossref(self, data, timing, message) for data in meta] if meta else [_ScholInfraResponse_Crossref(self, meta, timing, message)]
 
 
+    def iter_full_text_search (self, search_term, limit=None, exact_match=None, page_size=100):
+        """
+        page through a Crossref API search using deep paging cursors
+        """
+        message = None
+        t0 = time.time()
+        count = 0
+        cursor = "*"
+
+        try:
+            while cursor:
+                query = "query=%22{}%22/type/journal-article&rows={}&cursor={}".format(urllib.parse.quote(search_term), page_size, urllib.parse.quote(cursor))
+                url = self._get_api_url(query)
+
+                response = self._get(url).text
+                json_response = json.loads(response)
+                meta = json_response["message"].get("items") or []
+                timing = self._mark_elapsed_time(t0)
+
+                for data in meta:
+                    yield _ScholInfraResponse_Crossref(self, data, timing, message)
+                    count += 1
+
+                    if self._limit_reached(count, limit):
+                        return
+
+                if len(meta) < page_size:
+                    return
+
+                cursor = json_response["message"].get("next-cursor")
+        except Exception:
+            message = self._report_error(search_term)
+
+            timing = self._mark_elapsed_time(t0)
+            yield _ScholInfraResponse_Crossref(self, None, timing, message)
+
+
 class _ScholInfra_PubMed (_ScholInfra):
     """
     parse metadata returned from PubMed's Entrez API given a title
     """
 
-    def title_search (self, title):
-        meta = None
-        timing = 0.0
-        message = None
+    def _get_rate_limit (self):
+        """
+        NCBI permits 10 requests per second with an API key, otherwise 3
+        """
+        if self._get_config("rate_limit") is None:
+            if self._get_config("ncbi_api_key"):
+                return 10.0
+            else:
+                return 3.0
 
-        t0 = time.time()     
+        return super()._get_rate_limit()
+
+
+    def _entrez_setup (self):
+        """
+        identify ourselves to NCBI and set the socket timeout, cut
+        short by any deadline -- which must be called before each
+        Entrez request, run through `_call_library()` for its rate limit
+        """
         Entrez.email = self.parent.config["DEFAULT"]["email"]
+        Entrez.api_key = self._get_config("ncbi_api_key")
+        Entrez.urlopen = _entrez_urlopen
+
+        connect, read = self._get_timeout()
+        _ENTREZ_TIMEOUT.set(max(connect, read))
+
+        # retries follow `_call_library()` and its deadline instead
+        Entrez.max_tries = 1
 
+
+    def _esearch_title (self, title):
+        """
+        list the PMIDs of articles whose title matches
+        """
+        self._entrez_setup()
         handle = Entrez.read(Entrez.esearch(
                 db="pubmed",
                 retmax=100,
@@ -911,64 +2859,166 @@ class _ScholInfra_PubMed (_ScholInfra):
                 field = "title",
                 retmode = "xml"
                 ))
-        
-        id_list = handle.get("IdList", [])
-        search_id = id_list[0] if len(id_list) > 0 else None
 
-        if search_id:
-            fetch_result = Entrez.efetch(db="pubmed", id=search_id, retmode="xml")
-            data = fetch_result.read()
+        return [ str(pmid) for pmid in handle.get("IdList", []) ]
+
+
+    def _efetch (self, pmid):
+        """
+        fetch the XML for one PubMed article
+        """
+        self._entrez_setup()
+        fetch_result = Entrez.efetch(db="pubmed", id=pmid, retmode="xml")
+
+        try:
+            return fetch_result.read()
+        finally:
             fetch_result.close()
 
-            xml = xmltodict.parse(data)
-            parsed = json.loads(json.dumps(xml))
 
-            if "PubmedArticle" in parsed["PubmedArticleSet"]:
-                parsed = parsed["PubmedArticleSet"]["PubmedArticle"]
-                result_title = parsed["MedlineCitation"]["Article"]["ArticleTitle"]
+    @_negative_cache
+    def title_search (self, title):
+        meta = None
+        timing = 0.0
+        message = None
+
+        t0 = time.time()     
+
+        try:
+            id_list = self._get_cached_result(
+                "esearch_title",
+                [ self._clean_title(title) ],
+                lambda: self._call_library("esearch", self._esearch_title, title),
+                lambda ids: len(ids) > 0
+                )
+            search_id = id_list[0] if len(id_list) > 0 else None
+
+            if search_id:
+                data = self._get_cached_result("efetch", [ search_id ], lambda: self._call_library("efetch", self._efetch, search_id))
+                parsed = self._xml_to_dict(data)
 
-                if self.title_match(title, result_title):
-                    if parsed and len(parsed) > 0:
-                        meta = parsed
+                if "PubmedArticle" in parsed["PubmedArticleSet"]:
+                    parsed = parsed["PubmedArticleSet"]["PubmedArticle"]
+                    result_title = parsed["MedlineCitation"]["Article"]["ArticleTitle"]
+
+                    if self.title_match(title, result_title):
+                        if parsed and len(parsed) > 0:
+                            meta = parsed
+
+        except Exception:
+            meta = None
+            message = self._report_error(title)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_PubMed(self, meta, timing, message)
 
 
-    def _full_text_get_ids (self, search_term, limit=None):
+    def _full_text_post_query (self, search_term):
+        """
+        run the search on the Entrez history server, returning the
+        count of matching articles and the `WebEnv`/`query_key` pair
+        used to fetch them later
+        """
+        self._entrez_setup()
+        handle = Entrez.read(Entrez.esearch(
+            db="pubmed",
+            retmax=0,
+            usehistory="y",
+            term="\"{}\"".format(search_term)
+            )
+        )
+
+        return int(handle["Count"]), handle["WebEnv"], handle["QueryKey"]
+
+
+    def _full_text_fetch_chunk (self, webenv, query_key, retstart, retmax):
+        """
+        request one chunk of articles from the Entrez history server,
+        returning the response stream
+        """
+        self._entrez_setup()
+
+        return Entrez.efetch(
+            db="pubmed",
+            webenv=webenv,
+            query_key=query_key,
+            retstart=retstart,
+            retmax=retmax,
+            retmode="xml"
+            )
+
+
+    def _iter_articles (self, fetch_result):
+        """
+        parse the articles from an Entrez response stream incrementally,
+        one at a time
+        """
+        try:
+            for node in self._iterparse_xml(fetch_result, "PubmedArticle"):
+                yield self._xml_to_dict(ElementTree.tostring(node))["PubmedArticle"]
+        finally:
+            fetch_result.close()
+
+
+    def full_text_search_batched (self, search_term, limit=None, batch_size=200):
+        """
+        PubMed full-text search using the Entrez history server, which
+        fetches the matching articles in chunks of `batch_size` and
+        yields a response per article as each chunk arrives -- so that
+        memory stays bounded for popular search terms
+        """
+        timing = 0.0
+        message = None
+        t0 = time.time()
+
         try:
             limit = int(limit)
-        except ValueError: #if limit can't be casted into int
+        except (TypeError, ValueError): #if limit can't be casted into int
             limit = None
 
-        id_list = None
-        Entrez.email = self.parent.config["DEFAULT"]["email"]
+        try:
+            # post the query to the history server only once a result
+            # is needed which hasn't been cached
+            history = []
 
-        query_return = Entrez.read(Entrez.egquery(term="\"{}\"".format(search_term)))
-        response_count = int([d for d in query_return["eGQueryResult"] if d["DbName"] == "pubmed"][0]["Count"])
+            def post_query ():
+                if not history:
+                    history.extend(self._call_library("esearch", self._full_text_post_query, search_term))
 
-        if response_count > 0:
-            if limit == None:
-                handle = Entrez.read(Entrez.esearch(
-                    db="pubmed",
-                    retmax=response_count,
-                    term="\"{}\"".format(search_term)
-                    )
-                )
+                return history
 
-                id_list = handle["IdList"]
+            def fetch_chunk (retstart, retmax):
+                _, webenv, query_key = post_query()
+                fetch_result = self._call_library("efetch", self._full_text_fetch_chunk, webenv, query_key, retstart, retmax)
+                return self._iter_articles(fetch_result)
 
-            elif limit > 0:
-                handle = Entrez.read(Entrez.esearch(
-                    db="pubmed",
-                    retmax=limit,
-                    term="\"{}\"".format(search_term)
-                    )
-                )
+            response_count = self._get_cached_result("esearch_count", [ search_term ], lambda: post_query()[0])
+
+            if limit is not None:
+                response_count = min(response_count, max(limit, 0))
+
+            for retstart in range(0, response_count, batch_size):
+                retmax = min(batch_size, response_count - retstart)
 
-                id_list = handle["IdList"]
+                if self._get_result_cache():
+                    chunk = self._get_cached_result(
+                        "efetch_chunk",
+                        [ search_term, retstart, retmax ],
+                        lambda: list(fetch_chunk(retstart, retmax))
+                        )
+                else:
+                    # nothing to cache, so yield each article as it
+                    # gets parsed
+                    chunk = fetch_chunk(retstart, retmax)
+
+                for data in chunk:
+                    timing = self._mark_elapsed_time(t0)
+                    yield _ScholInfraResponse_PubMed(self, data, timing, message)
+        except Exception:
+            message = self._report_error(search_term)
 
-        return id_list
+            timing = self._mark_elapsed_time(t0)
+            yield _ScholInfraResponse_PubMed(self, None, timing, message)
 
 
     def full_text_search (self, search_term, limit=None, exact_match=None):
@@ -980,33 +3030,30 @@ class _ScholInfra_PubMed (_ScholInfra):
         message = None
 
         t0 = time.time()
-        Entrez.email = self.parent.config["DEFAULT"]["email"]
-        id_list = self._full_text_get_ids(search_term, limit)
+        responses = list(self.full_text_search_batched(search_term, limit))
         
-        if id_list and len(id_list) > 0:
-            id_list = ",".join(id_list)
-
-            fetch_result = Entrez.efetch(
-                db="pubmed",
-                id=id_list,
-                retmode = "xml"
-                )
+        timing = self._mark_elapsed_time(t0)
+        return responses if responses else [_ScholInfraResponse_PubMed(self, meta, timing, message)]
 
-            data = fetch_result.read()
-            fetch_result.close()
 
-            xml = xmltodict.parse(data)
-            meta_list = json.loads(json.dumps(xml))
-            meta = meta_list["PubmedArticleSet"]["PubmedArticle"]
-                
-        timing = self._mark_elapsed_time(t0)
-        return [_ScholInfraResponse_PubMed(self, data, timing, message) for data in meta] if meta else [_ScholInfraResponse_PubMed(self, meta, timing, message)]
+    def iter_full_text_search (self, search_term, limit=None, exact_match=None, page_size=200):
+        """
+        page through a PubMed full-text search on the history server
+        """
+        return self.full_text_search_batched(search_term, limit=limit, batch_size=page_size)
 
                         
     def journal_lookup (self, identifier):
         """
         use the NCBI discovery service for ISSN lookup
         """
+        return self._run_steps(self._journal_lookup_steps(identifier))
+
+
+    def _journal_lookup_steps (self, identifier):
+        """
+        generator for the API requests of `journal_lookup()`
+        """
         meta = None
         timing = 0.0
         message = None
@@ -1015,7 +3062,7 @@ class _ScholInfra_PubMed (_ScholInfra):
 
         try:
             url = "https://www.ncbi.nlm.nih.gov/nlmcatalog/?report=xml&format=text&term={}".format(identifier)
-            response = requests.get(url).text
+            response = (yield url).text
 
             soup = BeautifulSoup(response, "html.parser")
             xml = soup.find("pre").text.strip()
@@ -1024,7 +3071,7 @@ class _ScholInfra_PubMed (_ScholInfra):
                 ## use an XML hack to workaround common formatting
                 ## errors in the API respsonses from NCBI
                 xml = "<fix>{}</fix>".format(xml)
-                j = json.loads(json.dumps(xmltodict.parse(xml)))
+                j = self._xml_to_dict(xml)
 
                 if "NCBICatalogRecord" in j["fix"]:
                     ncbi = j["fix"]["NCBICatalogRecord"]
@@ -1043,11 +3090,9 @@ class _ScholInfra_PubMed (_ScholInfra):
                     meta = ncbi["JrXml"]["Serial"]
                     #pprint.pprint(meta)
 
-        except:
-            print(traceback.format_exc())
+        except Exception:
             meta = None
-            message = f"ERROR: {identifier}"
-            print(message)
+            message = self._report_error(identifier)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_PubMed(self, meta, timing, message, False)
@@ -1065,6 +3110,13 @@ class _ScholInfra_DataCite (_ScholInfra):
         """
         parse metadata returned from DataCite API given a DOI
         """
+        return self._run_steps(self._publication_lookup_steps(identifier))
+
+
+    def _publication_lookup_steps (self, identifier):
+        """
+        generator for the API requests of `publication_lookup()`
+        """
         meta = None
         timing = 0.0
         message = None
@@ -1072,23 +3124,36 @@ class _ScholInfra_DataCite (_ScholInfra):
         t0 = time.time()
         url = self._get_api_url("/" + identifier)
 
-        response = requests.get(url)
+        try:
+            response = yield url
 
-        if response.status_code == 200:
-            json_response = json.loads(response.text)
-            meta = json_response["data"]
-        else:
+            if response.status_code == 200:
+                json_response = json.loads(response.text)
+                meta = json_response["data"]
+            else:
+                meta = None
+                message = response.text
+
+        except Exception:
             meta = None
-            message = response.text
+            message = self._report_error(identifier)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_Datacite(self, meta, timing, message)
 
     
+    @_negative_cache
     def title_search (self, title):
         """
         parse metadata from the DataCite API query
         """
+        return self._run_steps(self._title_search_steps(title))
+
+
+    def _title_search_steps (self, title):
+        """
+        generator for the API requests of `title_search()`
+        """
         meta = None
         timing = 0.0
         message = None
@@ -1098,35 +3163,36 @@ class _ScholInfra_DataCite (_ScholInfra):
         url = self._get_api_url("?resource-type-id=text&query=titles.title:{}".format(query))
         
         try:
-            response = requests.get(url)            
+            response = yield url
 
             if response.status_code == 200:
                 json_response = json.loads(response.text)
                 entries = json_response["data"]
+                min_score = 0.9 # a heuristic/guess -- we need to analyze this
                 max_score = 0.0
+                title_key = TitleKey(title)
 
                 for entry in entries:
                     titles = entry.get("attributes")["titles"]
 
                     for title_obj in titles:
-                        s = SequenceMatcher(None, title_obj["title"], title)
+                        # only a better match than the best so far matters
+                        score = self.title_similarity(title_obj["title"], title_key, max(max_score, min_score))
 
-                        if (s.ratio() > max_score):
+                        if score > max_score:
                             meta = entry
-                            max_score = s.ratio()
+                            max_score = score
 
-                if max_score < 0.9: # a heuristic/guess -- we need to analyze this
+                if max_score < min_score:
                     meta = None
 
             else:
                 meta = None
                 message = response.text
 
-        except:
-            print(traceback.format_exc())
+        except Exception:
             meta = None
-            message = f"ERROR: {title}"
-            print(message)
+            message = self._report_error(title)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_Datacite(self, meta, timing, message)
@@ -1136,6 +3202,13 @@ class _ScholInfra_DataCite (_ScholInfra):
         """
         DataCite full-text search
         """
+        return self._run_steps(self._full_text_search_steps(search_term, limit=limit, exact_match=exact_match))
+
+
+    def _full_text_search_steps (self, search_term, limit=None, exact_match=None):
+        """
+        generator for the API requests of `full_text_search()`
+        """
         meta = None
         timing = 0.0
         message = None 
@@ -1149,19 +3222,72 @@ class _ScholInfra_DataCite (_ScholInfra):
         if limit:
             url = url + "&page[size]={}".format(limit)
 
-        response = requests.get(url)
+        try:
+            response = yield url
 
-        if response.status_code == 200:
-            json_response = json.loads(response.text)
-            meta = json_response["data"]
-        else:
+            if response.status_code == 200:
+                json_response = json.loads(response.text)
+                meta = json_response["data"]
+            else:
+                meta = None
+                message = response.text
+
+        except Exception:
             meta = None
-            message = response.text
+            message = self._report_error(search_term)
 
         timing = self._mark_elapsed_time(t0)
         return [_ScholInfraResponse_Datacite(self, data, timing, message) for data in meta] if meta else [_ScholInfraResponse_Datacite(self, meta, timing, message)]
 
 
+    def iter_full_text_search (self, search_term, limit=None, exact_match=None, page_size=100):
+        """
+        page through a DataCite full-text search, following the `next`
+        links of cursor-based pagination -- which unlike `page[number]`
+        is not capped at 10,000 results
+        """
+        message = None
+        t0 = time.time()
+        count = 0
+
+        if exact_match:
+            url = self._get_api_url("?resource-type-id=text&query={}".format(self._format_exact_quote(search_term)))
+        else:
+            url = self._get_api_url("?resource-type-id=text&query={}".format(urllib.parse.quote_plus(search_term)))
+
+        url = url + "&page[cursor]=1&page[size]={}".format(page_size)
+
+        try:
+            while url:
+                response = self._get(url)
+
+                if response.status_code != 200:
+                    message = response.text
+                    break
+
+                json_response = json.loads(response.text)
+                meta = json_response["data"]
+                timing = self._mark_elapsed_time(t0)
+
+                for data in meta:
+                    yield _ScholInfraResponse_Datacite(self, data, timing, message)
+                    count += 1
+
+                    if self._limit_reached(count, limit):
+                        return
+
+                if len(meta) < page_size:
+                    return
+
+                url = json_response.get("links", {}).get("next")
+        except Exception:
+            message = self._report_error(search_term)
+
+        if message:
+            timing = self._mark_elapsed_time(t0)
+            yield _ScholInfraResponse_Datacite(self, None, timing, message)
+
+
 class _ScholInfra_CORE (_ScholInfra): 
 
     def has_credentials (self):
@@ -1178,6 +3304,13 @@ class _ScholInfra_CORE (_ScholInfra):
         """
         parse metadata returned from CORE API given a DOI
         """
+        return self._run_steps(self._publication_lookup_steps(identifier))
+
+
+    def _publication_lookup_steps (self, identifier):
+        """
+        generator for the API requests of `publication_lookup()`
+        """
         meta = None
         timing = 0.0
         message = None
@@ -1188,7 +3321,7 @@ class _ScholInfra_CORE (_ScholInfra):
             search_query = urllib.parse.quote("doi:\""+ identifier + "\"")
 
             url = self._get_api_url("articles", "search", search_query + "?" + urllib.parse.urlencode(params) )
-            response = requests.get(url)
+            response = yield url
 
             if response.status_code == 200:
                 json_response = json.loads(response.text)
@@ -1201,20 +3334,26 @@ class _ScholInfra_CORE (_ScholInfra):
             else:
                 meta = None
                 message = response.text
-        except: 
-            print(traceback.format_exc())
+        except Exception: 
             meta = None
-            message = f"ERROR: {identifier}"
-            print(message)
+            message = self._report_error(identifier)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_CORE(self, meta, timing, message)
 
 
+    @_negative_cache
     def title_search (self, title):
         """
         parse metadata from the CORE API query
         """
+        return self._run_steps(self._title_search_steps(title))
+
+
+    def _title_search_steps (self, title):
+        """
+        generator for the API requests of `title_search()`
+        """
         meta = None
         timing = 0.0
         message = None
@@ -1225,7 +3364,7 @@ class _ScholInfra_CORE (_ScholInfra):
             search_query = urllib.parse.quote("title:\""+ title + "\"")
 
             url = self._get_api_url("articles", "search", search_query + "?" + urllib.parse.urlencode(params) )
-            response = requests.get(url)
+            response = yield url
 
             if response.status_code == 200:
                 json_response = json.loads(response.text)
@@ -1241,11 +3380,9 @@ class _ScholInfra_CORE (_ScholInfra):
             else:
                 meta = None
                 message = response.text
-        except:
-            print(traceback.format_exc())
+        except Exception:
             meta = None
-            message = f"ERROR: {title}"
-            print(message)
+            message = self._report_error(title)
         
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_CORE(self, meta, timing, message)     
@@ -1255,6 +3392,13 @@ class _ScholInfra_CORE (_ScholInfra):
         """
         CORE full-text search
         """
+        return self._run_steps(self._full_text_search_steps(search_term, limit=limit, exact_match=exact_match))
+
+
+    def _full_text_search_steps (self, search_term, limit=None, exact_match=None):
+        """
+        generator for the API requests of `full_text_search()`
+        """
         meta = None
         timing = 0.0
         message = None 
@@ -1271,7 +3415,7 @@ class _ScholInfra_CORE (_ScholInfra):
                 search_query = urllib.parse.quote(search_term)
             
             url = self._get_api_url("articles", "search", search_query + "?" + urllib.parse.urlencode(params) )
-            response = requests.get(url)
+            response = yield url
 
             if response.status_code == 200:
                 json_response = json.loads(response.text)
@@ -1284,17 +3428,80 @@ class _ScholInfra_CORE (_ScholInfra):
             else:
                 meta = None
                 message = response.text
-        except:
-            print(traceback.format_exc())
+        except Exception:
             meta = None
-            message = f"ERROR: {search_term}"
-            print(message)
+            message = self._report_error(search_term)
                     
         timing = self._mark_elapsed_time(t0)
         return [_ScholInfraResponse_CORE(self, data, timing, message) for data in meta] if meta else [_ScholInfraResponse_CORE(self, meta, timing, message)]
 
+
+    def iter_full_text_search (self, search_term, limit=None, exact_match=None, page_size=100):
+        """
+        page through a CORE full-text search; note that CORE accepts
+        page sizes from 10 to 100
+        """
+        message = None
+        t0 = time.time()
+        count = 0
+        page = 1
+
+        if exact_match:
+            search_query = '"' + urllib.parse.quote_plus(search_term.strip()) + '"'
+        else:
+            search_query = urllib.parse.quote(search_term)
+
+        try:
+            while True:
+                params = self._get_core_apikey()
+                params["page"] = page
+                params["pageSize"] = page_size
+
+                url = self._get_api_url("articles", "search", search_query + "?" + urllib.parse.urlencode(params) )
+                response = self._get(url)
+
+                if response.status_code != 200:
+                    message = response.text
+                    break
+
+                json_response = json.loads(response.text)
+
+                if json_response["status"] == "Not found":
+                    break
+                elif json_response["status"] != "OK":
+                    message = json_response["status"]
+                    break
+
+                meta = json_response["data"] or []
+                timing = self._mark_elapsed_time(t0)
+
+                for data in meta:
+                    yield _ScholInfraResponse_CORE(self, data, timing, message)
+                    count += 1
+
+                    if self._limit_reached(count, limit):
+                        return
+
+                if len(meta) < 1 or page * page_size >= json_response.get("totalHits", 0):
+                    break
+
+                page += 1
+        except Exception:
+            message = self._report_error(search_term)
+
+        if message:
+            timing = self._mark_elapsed_time(t0)
+            yield _ScholInfraResponse_CORE(self, None, timing, message)
+
     
     def journal_lookup (self, identifier):
+        return self._run_steps(self._journal_lookup_steps(identifier))
+
+
+    def _journal_lookup_steps (self, identifier):
+        """
+        generator for the API requests of `journal_lookup()`
+        """
         meta = None
         timing = 0.0
         message = None 
@@ -1303,7 +3510,7 @@ class _ScholInfra_CORE (_ScholInfra):
         try:
             params = self._get_core_apikey()
             url = self._get_api_url("journals", "get", identifier + "?" + urllib.parse.urlencode(params) )
-            response = requests.get(url)
+            response = yield url
 
             if response.status_code == 200:
                 json_response = json.loads(response.text)
@@ -1316,11 +3523,9 @@ class _ScholInfra_CORE (_ScholInfra):
             else:
                 meta = None
                 message = response.text
-        except:
-            print(traceback.format_exc())
+        except Exception:
             meta = None
-            message = f"ERROR: {identifier}"
-            print(message)
+            message = self._report_error(identifier)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_CORE(self, meta, timing, message, False)
@@ -1332,6 +3537,13 @@ class _ScholInfra_ORCID (_ScholInfra):
         """
         parse metadata returned from ORCID API given an ORCID identifier
         """
+        return self._run_steps(self._publication_lookup_steps(identifier))
+
+
+    def _publication_lookup_steps (self, identifier):
+        """
+        generator for the API requests of `publication_lookup()`
+        """
         meta = None
         timing = 0.0
         message = None
@@ -1339,17 +3551,14 @@ class _ScholInfra_ORCID (_ScholInfra):
 
         try:
             url = self._get_api_url(identifier, "works")
-            response = requests.get(url)
-            xml = xmltodict.parse(response.text, xml_attribs=False)
+            response = yield url
+            xml = self._xml_to_dict(response.text, xml_attribs=False)
 
             if xml is not None:
-                xml = (xml["activities:works"] or {}).get("activities:group")
-                meta = json.loads(json.dumps(xml))
-        except:
-            print(traceback.format_exc())
+                meta = (xml["activities:works"] or {}).get("activities:group")
+        except Exception:
             meta = None
-            message = f"ERROR: {identifier}"
-            print(message)
+            message = self._report_error(identifier)
 
         timing = self._mark_elapsed_time(t0)
         return [_ScholInfraResponse_ORCID(self, data, timing, message) for data in meta] if meta else [_ScholInfraResponse_ORCID(self, meta, timing, message)]
@@ -1366,17 +3575,14 @@ class _ScholInfra_ORCID (_ScholInfra):
 
         try:
             url = self._get_api_url(identifier, "employments")
-            response = requests.get(url)
-            xml = xmltodict.parse(response.text, xml_attribs=False)
+            response = self._get(url)
+            xml = self._xml_to_dict(response.text, xml_attribs=False)
 
             if xml is not None:
-                xml = (xml["activities:employments"] or {}).get("employment:employment-summary")
-                meta = json.loads(json.dumps(xml))
+                meta = (xml["activities:employments"] or {}).get("employment:employment-summary")
         except: 
-            print(traceback.format_exc())
             meta = None
-            message = f"ERROR: {identifier}"
-            print(message)
+            message = self._report_error(identifier)
 
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_ORCID(self, meta, timing, message, False)
@@ -1393,45 +3599,143 @@ class _ScholInfra_ORCID (_ScholInfra):
 
         try:
             url = self._get_api_url(identifier, "fundings")
-            response = requests.get(url)
-            xml = xmltodict.parse(response.text, xml_attribs=False)
+            response = self._get(url)
+            xml = self._xml_to_dict(response.text, xml_attribs=False)
 
             if xml is not None:
-                xml = (xml["activities:fundings"] or {}).get("activities:group")
-                meta = json.loads(json.dumps(xml))
+                meta = (xml["activities:fundings"] or {}).get("activities:group")
         except:
-            print(traceback.format_exc())
             meta = None
-            message = f"ERROR: {identifier}"
-            print(message)
+            message = self._report_error(identifier)
+
+        timing = self._mark_elapsed_time(t0)
+        return _ScholInfraResponse_ORCID(self, meta, timing, message, False)
+
+
+class _ScholInfra_NSF_PAR (_ScholInfra): 
+
+    def __init__ (self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._cookies_expire = None
+        self._cookies_generation = 0
+        self._cookies_lock = threading.Lock()
+
+
+    def _request_data (self, search_url, export_url, limit=None): 
+        """
+        export the results of an NSF PAR search as a list of up to
+        `limit` dicts, cached since each export needs a browser session
+        -- although an empty export doesn't get cached
+        """
+        return self._get_cached_result(
+            "request_data",
+            [ search_url, export_url, limit ],
+            lambda: self._export_data(search_url, export_url, limit),
+            lambda data: len(data) > 0
+            )
+
+
+    def _refresh_cookies (self, search_url):
+        """
+        open an NSF PAR search in a headless browser, then copy its
+        session cookies into this provider's session, noting when the
+        first of them expires
+        """
+        with self.parent._get_browser_pool().browser() as browser:
+            browser.get(search_url)
+            cookies = browser.get_cookies()
+
+        session = self._get_session()
+        session.cookies.clear()
+
+        for c in cookies:
+            session.cookies.set(c["name"], c["value"])
+
+        expiries = [ c["expiry"] for c in cookies if "expiry" in c ]
+        self._cookies_expire = min(expiries) if expiries else math.inf
+        self._cookies_generation += 1
+
+
+    @classmethod
+    def _is_export (cls, response):
+        """
+        without valid session cookies, NSF PAR responds with an error
+        or an HTML page instead of the CSV export
+        """
+        return response.status_code not in (401, 403) and "html" not in response.headers.get("Content-Type", "")
+
+
+    def _post_csv (self, export_url):
+        """
+        POST for a CSV export as a stream, raising an error for a
+        response which is worth retrying
+        """
+        resp = self._get_session().post(export_url, timeout=self._get_timeout(), stream=True)
+
+        if resp.status_code in _RETRY_STATUS:
+            resp.close()
+            resp.raise_for_status()
+
+        return resp
+
+
+    def _post_export (self, search_url, export_url):
+        """
+        POST for the CSV export of an NSF PAR search, reusing the
+        session cookies from an earlier search until they expire, and
+        only launching a browser to refresh them when they're missing,
+        expired, or rejected
+        """
+        # fail fast, without launching a browser for cookies
+        if self._circuit_breaker.is_open():
+            raise _CircuitOpenError(f"{self.name}: {export_url}")
+
+        with self._cookies_lock:
+            if self._cookies_expire is None or time.time() >= self._cookies_expire:
+                self._refresh_cookies(search_url)
 
-        timing = self._mark_elapsed_time(t0)
-        return _ScholInfraResponse_ORCID(self, meta, timing, message, False)
+            generation = self._cookies_generation
 
+        resp = self._call_library("export", self._post_csv, export_url)
 
-class _ScholInfra_NSF_PAR (_ScholInfra): 
+        if not self._is_export(resp):
+            resp.close()
+
+            with self._cookies_lock:
+                # unless another thread already refreshed them
+                if generation == self._cookies_generation:
+                    self._refresh_cookies(search_url)
 
-    def _request_data (self, search_url, export_url): 
-        with requests.Session() as session:
-            chrome_path = self.parent.config["DEFAULT"]["chrome_exe_path"]                
-            chrome_options = Options()  
-            chrome_options.add_argument("--headless")  
+            resp = self._call_library("export", self._post_csv, export_url)
 
-            browser = webdriver.Chrome(executable_path=chrome_path, options=chrome_options)
-            browser.get(search_url)        
+            if not self._is_export(resp):
+                resp.close()
+                raise ValueError(f"{self.name}: no CSV export for {search_url}")
 
-            request_cookies_browser = browser.get_cookies()
-            [session.cookies.set(c["name"], c["value"]) for c in request_cookies_browser]
+        if not resp.ok:
+            resp.close()
+            resp.raise_for_status()
 
-            resp = session.post(export_url)
-            reader = csv.DictReader(io.StringIO(resp.content.decode("utf-8"))) 
-            json_data = json.dumps(list(reader))
-            json_data = json.loads(json_data)  
+        return resp
+
+
+    def _export_data (self, search_url, export_url, limit=None): 
+        """
+        stream the CSV export for an NSF PAR search, parsing one line
+        at a time and closing the connection after `limit` rows
+        """
+        resp = self._post_export(search_url, export_url)
+        resp.raw.decode_content = True
 
-            browser.quit()      
-            session.close()
+        # otherwise urllib3 reports the stream closed at its end, before
+        # the text wrapper has read it all
+        resp.raw.auto_close = False
 
-        return json_data
+        try:
+            reader = csv.DictReader(io.TextIOWrapper(resp.raw, encoding="utf-8", newline=""))
+            return list(itertools.islice(reader, limit))
+        finally:
+            resp.close()
 
 
     def full_text_search (self, search_term, limit=None, exact_match=True):
@@ -1450,22 +3754,19 @@ class _ScholInfra_NSF_PAR (_ScholInfra):
             search_url = self._get_api_url("search", "fulltext:" + urllib.parse.quote(search_term))
             export_url = self._get_api_url("export/format:csv", "fulltext:" + urllib.parse.quote(search_term))
 
-            json_data = self._request_data(search_url, export_url)
-            
-            if limit and limit > 0 and limit < len(json_data):
-                meta = json_data[:limit]
+            if limit and limit > 0:
+                meta = self._request_data(search_url, export_url, limit)
             else:
-                meta = json_data
+                meta = self._request_data(search_url, export_url)
         except:
-            print(traceback.format_exc())
             meta = None
-            message = f"ERROR: {search_term}"
-            print(message) 
+            message = self._report_error(search_term)
 
         timing = self._mark_elapsed_time(t0)
         return [_ScholInfraResponse_NSF_PAR(self, data, timing, message) for data in meta] if meta else [_ScholInfraResponse_NSF_PAR(self, None, timing, message)]
 
 
+    @_negative_cache
     def title_search (self, title):
         """
         NSF PAR title search for a publication
@@ -1479,17 +3780,15 @@ class _ScholInfra_NSF_PAR (_ScholInfra):
             search_url = self._get_api_url("search", "title:" + urllib.parse.quote(title))
             export_url = self._get_api_url("export/format:csv", "title:" + urllib.parse.quote(title))
  
-            json_data = self._request_data(search_url, export_url)
+            json_data = self._request_data(search_url, export_url, 1)
             
             if  json_data and len(json_data) > 0:
                 meta = json_data[0]
             else:
                 meta = None
         except:
-            print(traceback.format_exc())
             meta = None
-            message = f"ERROR: {title}"
-            print(message) 
+            message = self._report_error(title)
         
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_NSF_PAR(self, meta, timing, message)
@@ -1508,17 +3807,15 @@ class _ScholInfra_NSF_PAR (_ScholInfra):
             search_url = self._get_api_url("search", "identifier:" + urllib.parse.quote(identifier))
             export_url = self._get_api_url("export/format:csv", "identifier:" + urllib.parse.quote(identifier))
  
-            json_data = self._request_data(search_url, export_url)
+            json_data = self._request_data(search_url, export_url, 1)
             
             if  json_data and len(json_data) > 0:
                 meta = json_data[0]
             else:
                 meta = None
         except:
-            print(traceback.format_exc())
             meta = None
-            message = f"ERROR: {identifier}"
-            print(message) 
+            message = self._report_error(identifier)
         
         timing = self._mark_elapsed_time(t0)
         return _ScholInfraResponse_NSF_PAR(self, meta, timing, message)
@@ -1920,94 +4217,361 @@ class ScholInfraAPI:
         self.config = configparser.ConfigParser()
         self.config.read(config_file)
         self.logger = logger
-
-        # other initializations 
-        requests_cache.install_cache("richcontext")
+        self._result_cache = None
+        self._result_cache_lock = threading.Lock()
+        self._browser_pool = None
+        self._browser_pool_lock = threading.Lock()
 
         self.crossref = _ScholInfra_Crossref(
             parent=self,
             name="Crossref",
-            api_url ="https://api.crossref.org/works?{}"
+            api_url ="https://api.crossref.org/works?{}",
+            response_class=_ScholInfraResponse_Crossref,
+            rate_limit=50,
+            cache_expire=30 * 24 * 3600
             )
         
         self.europepmc = _ScholInfra_EuropePMC(
             parent=self,
             name="EuropePMC",
-            api_url="https://www.ebi.ac.uk/europepmc/webservices/rest/search?query={}"
+            api_url="https://www.ebi.ac.uk/europepmc/webservices/rest/search?query={}",
+            response_class=_ScholInfraResponse_EuropePMC
             )
 
         self.openaire = _ScholInfra_OpenAIRE(
             parent=self,
             name="OpenAIRE",
-            api_url="http://api.openaire.eu/search/publications?"
+            api_url="http://api.openaire.eu/search/publications?",
+            response_class=_ScholInfraResponse_OpenAIRE
             )
 
         self.pubmed = _ScholInfra_PubMed(
             parent=self,
-            name="PubMed"
+            name="PubMed",
+            response_class=_ScholInfraResponse_PubMed
             )
 
         self.semantic = _ScholInfra_SemanticScholar(
             parent=self,
             name="Semantic Scholar",
-            api_url = "http://api.semanticscholar.org/v1/paper/{}"
+            api_url = "http://api.semanticscholar.org/v1/paper/{}",
+            response_class=_ScholInfraResponse_SemanticScholar,
+            # 100 requests per 5 minutes
+            rate_limit=100 / 300.0,
+            rate_burst=100
             )
 
         self.unpaywall = _ScholInfra_Unpaywall(
             parent=self,
             name="Unpaywall",
-            api_url = "https://api.unpaywall.org/v2/{}?email={}"
+            api_url = "https://api.unpaywall.org/v2/{}?email={}",
+            response_class=_ScholInfraResponse_Unpaywall,
+            cache_expire=24 * 3600
             )
 
         self.dissemin = _ScholInfra_dissemin(
             parent=self,
             name="dissemin",
-            api_url = "https://dissem.in/api/{}"
+            api_url = "https://dissem.in/api/{}",
+            response_class=_ScholInfraResponse_dissemin,
+            cache_expire=24 * 3600
             )
 
         self.dimensions = _ScholInfra_Dimensions(
             parent=self,
             name="Dimensions",
+            response_class=_ScholInfraResponse_Dimensions
             )
 
         self.repec = _ScholInfra_RePEc(
             parent=self,
             name="RePEc",
             api_url = "https://api.repec.org/call.cgi?code={}&getref={}",
-            cgi_url = "https://ideas.repec.org/cgi-bin/htsearch?q={}"
+            cgi_url = "https://ideas.repec.org/cgi-bin/htsearch?q={}",
+            response_class=_ScholInfraResponse_RePEc
             )
 
         self.ssrn = _ScholInfra_SSRN(
             parent=self,
             name="SSRN",
-            api_url ="https://doi.org/{}"
+            api_url ="https://doi.org/{}",
+            response_class=_ScholInfraResponse_SSRN
             )
 
         self.datacite = _ScholInfra_DataCite(
             parent=self,
             name="DataCite",
-            api_url="https://api.datacite.org/dois{}"
+            api_url="https://api.datacite.org/dois{}",
+            response_class=_ScholInfraResponse_Datacite
             )
 
         self.core = _ScholInfra_CORE(
             parent=self,
             name="CORE",
-            api_url="https://core.ac.uk:443/api-v2/{}/{}/{}"
+            api_url="https://core.ac.uk:443/api-v2/{}/{}/{}",
+            response_class=_ScholInfraResponse_CORE
             )
 
         self.orcid = _ScholInfra_ORCID (
             parent=self,
             name="ORCID",
-            api_url="https://pub.orcid.org/v2.0/{}/{}"
+            api_url="https://pub.orcid.org/v2.0/{}/{}",
+            response_class=_ScholInfraResponse_ORCID
             )
 
         self.nsfPar = _ScholInfra_NSF_PAR(
             parent=self,
             name="NSF PAR",
-            api_url="https://par.nsf.gov/{}/{}"
+            api_url="https://par.nsf.gov/{}/{}",
+            response_class=_ScholInfraResponse_NSF_PAR
             )
 
 
+    def _get_result_cache (self):
+        """
+        lazily open the result cache shared by the providers, named
+        after the `cache_name` configuration parameter
+        """
+        with self._result_cache_lock:
+            if not self._result_cache:
+                config = self.config["DEFAULT"]
+
+                if config.get("cache_backend") == "memory":
+                    path = ":memory:"
+                else:
+                    path = "{}_results.sqlite".format(config.get("cache_name", "richcontext"))
+
+                self._result_cache = _ResultCache(path)
+
+        return self._result_cache
+
+
+    def _start_browser (self):
+        """
+        launch a headless Chrome browser
+        """
+        chrome_path = self.config["DEFAULT"]["chrome_exe_path"]
+        chrome_options = Options()
+        chrome_options.add_argument("--headless")
+
+        return webdriver.Chrome(executable_path=chrome_path, options=chrome_options)
+
+
+    def _get_browser_pool (self):
+        """
+        lazily create the pool of headless browsers which the providers
+        borrow, sized by the `browser_pool_size` and
+        `browser_max_uses` configuration parameters
+        """
+        with self._browser_pool_lock:
+            if not self._browser_pool:
+                config = self.config["DEFAULT"]
+
+                self._browser_pool = _BrowserPool(
+                    self._start_browser,
+                    size=int(config.get("browser_pool_size", 2)),
+                    max_uses=int(config.get("browser_max_uses", 100))
+                    )
+
+        return self._browser_pool
+
+
+    def close (self):
+        """
+        release the resources held by each of the providers, such as
+        pooled HTTP connections, plus the result cache and any browsers
+        """
+        for source in vars(self).values():
+            if isinstance(source, _ScholInfra):
+                source.close()
+
+        with self._result_cache_lock:
+            if self._result_cache:
+                self._result_cache.close()
+                self._result_cache = None
+
+        with self._browser_pool_lock:
+            if self._browser_pool:
+                self._browser_pool.close()
+                self._browser_pool = None
+
+
+    def __enter__ (self):
+        return self
+
+
+    def __exit__ (self, exc_type, exc_value, traceback):
+        self.close()
+
+
+    def deadline (self, seconds):
+        """
+        context manager which bounds the total time, including
+        retries, of the API access methods called within its `with`
+        block, e.g., `with schol.deadline(5.0): ...`
+        """
+        return _deadline(seconds)
+
+
+    ## federated lookup
+
+    def _get_sources (self, method, providers):
+        """
+        select the discovery services named in `providers` which
+        implement the given method and have the required credentials
+        """
+        sources = []
+
+        for name in providers:
+            source = getattr(self, name)
+
+            if getattr(type(source), method) is getattr(_ScholInfra, method):
+                continue
+            elif source.has_credentials():
+                sources.append(source)
+
+        return sources
+
+
+    def _federated_call (self, source, method, query, deadline=None):
+        """
+        run one API access method within a worker thread, trapping any
+        errors so that one failed provider cannot abort the others, and
+        skipping providers whose circuit breaker is open
+        """
+        t0 = time.time()
+
+        try:
+            if source._circuit_breaker.is_open():
+                raise _CircuitOpenError(source.name)
+
+            if deadline is not None:
+                _set_deadline(deadline)
+
+            return getattr(source, method)(query)
+        except:
+            message = source._report_error(query)
+
+            timing = source._mark_elapsed_time(t0)
+            return source.response_class(source, None, timing, message)
+
+
+    def _federate (self, method, query, providers, max_workers, deadline):
+        """
+        fan one query out to several discovery services in parallel on
+        a bounded thread pool, yielding responses as they complete;
+        each call runs in a copy of the caller's context, so that any
+        deadline carries over into the worker threads -- and since
+        some providers make calls which the deadline cannot interrupt,
+        a provider still running when it passes gets an error response
+        instead of holding up the rest
+        """
+        sources = self._get_sources(method, providers)
+
+        if len(sources) < 1:
+            return
+
+        if not max_workers:
+            max_workers = len(sources)
+
+        if deadline is not None:
+            deadline += time.monotonic()
+
+        t0 = time.time()
+        timeout = _time_remaining()
+
+        if deadline is not None:
+            remaining = deadline - time.monotonic()
+            timeout = remaining if timeout is None else min(timeout, remaining)
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+
+        try:
+            futures = {
+                executor.submit(contextvars.copy_context().run, self._federated_call, source, method, query, deadline): source
+                for source in sources
+                }
+
+            try:
+                for future in concurrent.futures.as_completed(futures, timeout=timeout):
+                    del futures[future]
+                    yield future.result()
+            except concurrent.futures.TimeoutError:
+                for future, source in futures.items():
+                    if future.done():
+                        yield future.result()
+                    else:
+                        future.cancel()
+                        message = source._report_error(query)
+
+                        timing = source._mark_elapsed_time(t0)
+                        yield source.response_class(source, None, timing, message)
+        finally:
+            # don't wait on the stragglers, which finish in the background
+            executor.shutdown(wait=False)
+
+
+    def federated_publication_lookup (self, identifier, providers=None, max_workers=None, deadline=None):
+        """
+        Run `publication_lookup()` for the same DOI across multiple
+        discovery services concurrently, so that the overall latency
+        is that of the slowest provider rather than the sum of all.
+
+        :param identifier: DOI used to locate a specific publication.
+        :type identifier: str.
+
+        :param providers: Attribute names of the discovery services to
+        query, e.g., `["crossref", "unpaywall"]`; defaults to every
+        provider which supports DOI lookup without a browser.
+        :type providers: list.
+
+        :param max_workers: Size of the thread pool; defaults to one
+        thread per provider.
+        :type max_workers: int.
+
+        :param deadline: Seconds within which every provider's HTTP
+        requests must complete, including retries; by default, only
+        the timeouts for each request apply.
+        :type deadline: float.
+
+        :returns: generator of _ScholInfraResponse, in order of completion
+        """
+        if providers is None:
+            providers = _FEDERATED_PROVIDERS["publication_lookup"]
+
+        return self._federate("publication_lookup", identifier, providers, max_workers, deadline)
+
+
+    def federated_title_search (self, title, providers=None, max_workers=None, deadline=None):
+        """
+        Run `title_search()` for the same title across multiple
+        discovery services concurrently.
+
+        :param title: Query term to locate a specific publication.
+        :type title: str.
+
+        :param providers: Attribute names of the discovery services to
+        query, e.g., `["crossref", "europepmc"]`; defaults to every
+        provider which supports title search without a browser.
+        :type providers: list.
+
+        :param max_workers: Size of the thread pool; defaults to one
+        thread per provider.
+        :type max_workers: int.
+
+        :param deadline: Seconds within which every provider's HTTP
+        requests must complete, including retries; by default, only
+        the timeouts for each request apply.
+        :type deadline: float.
+
+        :returns: generator of _ScholInfraResponse, in order of completion
+        """
+        if providers is None:
+            providers = _FEDERATED_PROVIDERS["title_search"]
+
+        return self._federate("title_search", title, providers, max_workers, deadline)
+
+
     ## profiling utilities
 
     def start_profiling (self):
@@ -2030,6 +4594,404 @@ class ScholInfraAPI:
         print(s.getvalue())
 
 
+######################################################################
+## asyncio API access
+
+class _HTTPResponse:
+    """
+    the parts of a `requests.Response` which the API access methods
+    use, for a response received through the async HTTP client
+    """
+
+    def __init__ (self, status_code=None, text=None, headers=None, content=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+        self.content = content
+
+
+class _AsyncScholInfra:
+    """
+    asyncio access to a specific Scholarly Infrastructure API, sharing
+    the URL construction and response parsing of its synchronous
+    provider
+    """
+
+    def __init__ (self, source=None):
+        self.source = source
+        self.name = source.name
+        self._session = None
+
+
+    def has_credentials (self):
+        return self.source.has_credentials()
+
+
+    def report_perf (self, timing):
+        self.source.report_perf(timing)
+
+
+    def _get_session (self):
+        """
+        lazily create the async HTTP session for this provider, which
+        must happen within the running event loop; sized by the same
+        `pool_size` and `keep_alive` parameters as the synchronous
+        session
+        """
+        if not self._session:
+            connector = aiohttp.TCPConnector(
+                limit=int(self.source._get_config("pool_size", 10)),
+                force_close=not self.source._get_config_flag("keep_alive", True)
+                )
+
+            self._session = aiohttp.ClientSession(connector=connector)
+
+        return self._session
+
+
+    async def _get (self, url):
+        """
+        HTTP GET using this provider's async session, failing fast
+        while the circuit breaker which it shares with the synchronous
+        provider is open; this shares the synchronous provider's HTTP
+        cache, both reading from and writing to it
+        """
+        urls = _REQUESTED_URLS.get()
+
+        if urls is not None:
+            urls.append(url)
+
+        # the cache lookup hits sqlite, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        response = await loop.run_in_executor(None, self.source._get_cached, url)
+
+        if response is not None:
+            return response
+
+        breaker = self.source._circuit_breaker
+
+        if not breaker.allow():
+            raise _CircuitOpenError(f"{self.name}: {url}")
+
+        try:
+            response = await self._get_hedged(url)
+        except (_DeadlineExceeded, asyncio.CancelledError):
+            # the caller ran out of time, not the provider
+            breaker.release()
+            raise
+        except BaseException:
+            breaker.record_failure()
+            raise
+
+        if response.status_code in _RETRY_STATUS:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+            await loop.run_in_executor(None, self.source._save_cached, url, response)
+
+        return response
+
+
+    async def _get_hedged (self, url):
+        """
+        hedged HTTP GET, with the same hedge delay as the synchronous
+        provider: fire a duplicate request if the first is slow, then
+        take whichever response arrives first
+        """
+        delay = self.source._get_hedge_delay()
+
+        if delay is None:
+            return await self._get_with_retry(url)
+
+        tasks = [ asyncio.ensure_future(self._get_with_retry(url)) ]
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+
+        if not done:
+            if self.source.parent and self.source.parent.logger:
+                self.source.parent.logger.debug("{}: hedging after {:.3f} s - {}".format(self.name, delay, url))
+
+            tasks.append(asyncio.ensure_future(self._get_with_retry(url)))
+
+        try:
+            for i, task in enumerate(asyncio.as_completed(tasks)):
+                try:
+                    return await task
+                except Exception:
+                    if i == len(tasks) - 1:
+                        raise
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+    async def _get_with_retry (self, url):
+        """
+        HTTP GET within the rate limit which this provider shares with
+        the synchronous provider, and with the same timeouts and retry
+        policy
+        """
+        attempt = 0
+
+        while True:
+            await asyncio.sleep(self.source._rate_limiter.delay())
+
+            connect, read = self.source._get_timeout()
+            timeout = aiohttp.ClientTimeout(total=_time_remaining(), sock_connect=connect, sock_read=read)
+
+            try:
+                t0 = time.monotonic()
+
+                async with self._get_session().get(url, timeout=timeout) as response:
+                    self.source._rate_limiter.update(response.headers)
+                    delay = self.source._get_retry_delay(attempt, response.headers)
+
+                    if response.status not in _RETRY_STATUS or not self.source._can_retry(attempt, delay):
+                        content = await response.read()
+                        text = content.decode(response.get_encoding(), errors="replace")
+
+                        if response.status not in _RETRY_STATUS:
+                            self.source._latency.add(time.monotonic() - t0)
+
+                        return _HTTPResponse(response.status, text, response.headers, content)
+
+                    reason = response.status
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                delay = self.source._get_retry_delay(attempt)
+
+                if not self.source._can_retry(attempt, delay):
+                    raise
+
+                reason = type(e).__name__
+
+            self.source._log_retry(url, attempt, delay, reason)
+            await asyncio.sleep(delay)
+            attempt += 1
+
+
+    async def _run_steps (self, steps):
+        """
+        drive the generator for an API access method, awaiting each
+        HTTP GET request that it yields
+        """
+        try:
+            url = next(steps)
+
+            while True:
+                try:
+                    response = await self._get(url)
+                except Exception as e:
+                    url = steps.throw(e)
+                else:
+                    url = steps.send(response)
+        except StopIteration as e:
+            return e.value
+
+
+    async def _call (self, method, *args, **kwargs):
+        """
+        run an API access method natively if the provider splits it
+        into request steps, otherwise on the event loop's default
+        executor -- e.g., for the methods which use the Entrez or
+        dimcli libraries, or a browser
+        """
+        steps = getattr(self.source, "_{}_steps".format(method), None)
+
+        if not steps:
+            loop = asyncio.get_running_loop()
+            call = functools.partial(getattr(self.source, method), *args, **kwargs)
+            return await loop.run_in_executor(None, call)
+        elif getattr(getattr(self.source, method), "negative_cache", False):
+            # the result cache is sqlite too
+            loop = asyncio.get_running_loop()
+            response = await loop.run_in_executor(None, self.source._get_known_miss, method, args[0])
+
+            if response is None:
+                with _track_requests() as urls:
+                    response = await self._run_steps(steps(*args, **kwargs))
+
+                await loop.run_in_executor(None, self.source._record_miss, method, args[0], response, urls)
+
+            return response
+        else:
+            return await self._run_steps(steps(*args, **kwargs))
+
+
+    async def title_search (self, title):
+        """
+        coroutine for `title_search()`
+        """
+        return await self._call("title_search", title)
+
+
+    async def publication_lookup (self, identifier):
+        """
+        coroutine for `publication_lookup()`
+        """
+        return await self._call("publication_lookup", identifier)
+
+
+    async def full_text_search (self, search_term, **kwargs):
+        """
+        coroutine for `full_text_search()`, using the provider's
+        defaults for any `limit` or `exact_match` not given
+        """
+        return await self._call("full_text_search", search_term, **kwargs)
+
+
+    async def journal_lookup (self, identifier):
+        """
+        coroutine for `journal_lookup()`
+        """
+        return await self._call("journal_lookup", identifier)
+
+
+    async def close (self):
+        """
+        release the async HTTP connections for this provider
+        """
+        if self._session:
+            await self._session.close()
+            self._session = None
+
+
+class AsyncScholInfraAPI:
+    """
+    asyncio API integrations for federating metadata lookup across
+    multiple discovery service APIs, where the provider methods are
+    coroutines which return the same responses as `ScholInfraAPI`
+    """
+
+    def __init__ (self, config_file="rc.cfg", logger=None):
+        self.schol = ScholInfraAPI(config_file=config_file, logger=logger)
+        self.config = self.schol.config
+        self.logger = logger
+        self._sources = {}
+
+        for attr, source in vars(self.schol).items():
+            if isinstance(source, _ScholInfra):
+                self._sources[source] = _AsyncScholInfra(source)
+                setattr(self, attr, self._sources[source])
+
+
+    async def __aenter__ (self):
+        return self
+
+
+    async def __aexit__ (self, exc_type, exc_value, tb):
+        await self.close()
+
+
+    async def close (self):
+        """
+        release the resources held by each of the providers, such as
+        pooled HTTP connections
+        """
+        for source in self._sources.values():
+            await source.close()
+
+        self.schol.close()
+
+
+    def deadline (self, seconds):
+        """
+        context manager which bounds the total time, including
+        retries, of the coroutines awaited within its `with` block
+        """
+        return _deadline(seconds)
+
+
+    ## federated lookup
+
+    async def _federated_call (self, source, method, query, deadline=None):
+        """
+        await one API access method, trapping any errors so that one
+        failed provider cannot abort the others, and skipping providers
+        whose circuit breaker is open
+        """
+        t0 = time.time()
+
+        try:
+            if source.source._circuit_breaker.is_open():
+                raise _CircuitOpenError(source.name)
+
+            if deadline is None:
+                return await getattr(source, method)(query)
+
+            # this runs as its own task, so the deadline stays local
+            _set_deadline(deadline)
+            return await asyncio.wait_for(getattr(source, method)(query), _time_remaining())
+        except Exception:
+            message = source.source._report_error(query)
+
+            timing = source.source._mark_elapsed_time(t0)
+            return source.source.response_class(source.source, None, timing, message)
+
+
+    async def _federate (self, method, query, providers, deadline):
+        """
+        fan one query out to several discovery services concurrently,
+        yielding responses as they complete
+        """
+        if deadline is not None:
+            deadline += time.monotonic()
+
+        calls = [
+            self._federated_call(self._sources[source], method, query, deadline)
+            for source in self.schol._get_sources(method, providers)
+            ]
+
+        for call in asyncio.as_completed(calls):
+            yield await call
+
+
+    def federated_publication_lookup (self, identifier, providers=None, deadline=None):
+        """
+        Run `publication_lookup()` for the same DOI across multiple
+        discovery services concurrently.
+
+        :param identifier: DOI used to locate a specific publication.
+        :type identifier: str.
+
+        :param providers: Attribute names of the discovery services to
+        query; defaults to the same providers as `ScholInfraAPI`.
+        :type providers: list.
+
+        :param deadline: Seconds within which every provider must
+        respond, otherwise its response has an error message.
+        :type deadline: float.
+
+        :returns: async generator of _ScholInfraResponse, in order of completion
+        """
+        if providers is None:
+            providers = _FEDERATED_PROVIDERS["publication_lookup"]
+
+        return self._federate("publication_lookup", identifier, providers, deadline)
+
+
+    def federated_title_search (self, title, providers=None, deadline=None):
+        """
+        Run `title_search()` for the same title across multiple
+        discovery services concurrently.
+
+        :param title: Query term to locate a specific publication.
+        :type title: str.
+
+        :param providers: Attribute names of the discovery services to
+        query; defaults to the same providers as `ScholInfraAPI`.
+        :type providers: list.
+
+        :param deadline: Seconds within which every provider must
+        respond, otherwise its response has an error message.
+        :type deadline: float.
+
+        :returns: async generator of _ScholInfraResponse, in order of completion
+        """
+        if providers is None:
+            providers = _FEDERATED_PROVIDERS["title_search"]
+
+        return self._federate("title_search", title, providers, deadline)
+
+
 ######################################################################
 ## main entry point (not used)
 
@@ -26,14 +26,14 @@ setup(
         "Topic :: Scientific/Engineering :: Human Machine Interfaces",
         "Topic :: Scientific/Engineering :: Information Analysis",
     ],
-    python_requires=">=3.5",
+    python_requires=">=3.7",
     install_requires=[
+        "aiohttp",
         "beautifulsoup4",
         "biopython",
-        "crossref-commons",
         "dimcli",
         "requests",
-        "requests-cache",
+        "requests-cache>=1.0",
         "selenium",
         "xmltodict",
     ],
@@ -2,8 +2,19 @@
 # encoding: utf-8
 
 from richcontext import scholapi as rc_scholapi
+import asyncio
+import gzip
+import http.server
+import io
 import pprint
+import requests
+import requests_cache
+import threading
+import time
+import tracemalloc
 import unittest
+import unittest.mock
+import urllib.error
 import warnings
 
    
@@ -18,6 +29,31 @@ def ignore_warnings (test_func):
     return do_test
 
 
+def serve_locally (body, content_type="text/xml", status=200):
+    """run a local HTTP server which returns a gzipped `body` for every GET
+    """
+    class Handler (http.server.BaseHTTPRequestHandler):
+        requests = []
+
+        def do_GET (self):
+            Handler.requests.append(self.path)
+            data = gzip.compress(body.encode("utf-8"))
+
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Encoding", "gzip")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message (self, *args):
+            pass
+
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, Handler.requests
+
+
 class TestOpenAPIs (unittest.TestCase):
 
     ######################################################################
@@ -87,8 +123,20 @@ class TestOpenAPIs (unittest.TestCase):
 
     
     def test_pubmed_full_text_search (self):
-        #TODO
-        pass
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        source = schol.pubmed
+
+        search_term = "NHANES"
+        expected = 5
+
+        if source.has_credentials():
+            responses = source.full_text_search(search_term, limit=expected)
+            source.report_perf(responses[0].timing)
+            self.assertTrue(len(responses) == expected)
+
+            # fetching in chunks from the history server gives the same articles
+            responses_batched = list(source.full_text_search_batched(search_term, limit=expected, batch_size=2))
+            self.assertTrue([r.pmid() for r in responses_batched] == [r.pmid() for r in responses])
 
     ######################################################################
     ## Scholix family of APIs
@@ -119,6 +167,24 @@ class TestOpenAPIs (unittest.TestCase):
             self.assertTrue(response.message is not None)
             self.assertTrue(response.meta is None)
 
+
+    @ignore_warnings
+    def test_crossref_publication_lookup_batch (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        source = schol.crossref
+
+        dois = ["10.1503/cmaj.170880", "10.XXXX.XXXX", "10.1016/j.appet.2017.07.006"]
+        expected = "Relation between household food insecurity and breastfeeding in Canada"
+
+        if source.has_credentials():
+            responses = source.publication_lookup_batch(dois, batch_size=2)
+            source.report_perf(responses[0].timing)
+            self.assertTrue(len(responses) == len(dois))
+            self.assertTrue(responses[0].title() == expected)
+            self.assertTrue(responses[0].doi() == dois[0])
+            self.assertTrue(responses[1].meta is None)
+            self.assertTrue(responses[2].doi() == dois[2])
+
     def test_crossref_title_search (self):
         schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
         source = schol.crossref
@@ -151,6 +217,20 @@ class TestOpenAPIs (unittest.TestCase):
             self.assertTrue(len(responses) >= expected)
 
 
+    def test_crossref_iter_full_text_search (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        source = schol.crossref
+
+        search_term = "NHANES"
+        expected = 150
+
+        if source.has_credentials():
+            responses = list(source.iter_full_text_search(search_term, limit=expected, page_size=100))
+            source.report_perf(responses[-1].timing)
+            self.assertTrue(len(responses) == expected)
+            self.assertTrue(all(r.meta for r in responses))
+
+
     def test_datacite_publication_lookup (self):
         schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
         source = schol.datacite
@@ -224,6 +304,20 @@ class TestOpenAPIs (unittest.TestCase):
             self.assertTrue(len(responses) == expected)
 
 
+    def test_datacite_iter_full_text_search (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        source = schol.datacite
+
+        search_term = "NOAA NASA"
+        expected = 12
+
+        if source.has_credentials():
+            responses = list(source.iter_full_text_search(search_term, limit=expected, exact_match=True, page_size=5))
+            source.report_perf(responses[-1].timing)
+            self.assertTrue(len(responses) == expected)
+            self.assertTrue(len(set(r.doi() for r in responses)) == expected)
+
+
     def test_datacite__format_exact_quote (self):
         schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
         source = schol.datacite
@@ -273,6 +367,38 @@ class TestOpenAPIs (unittest.TestCase):
             self.assertTrue(len(responses) >= expected)
 
 
+    def test_openaire__parse_result (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        source = schol.openaire
+
+        response = """<?xml version="1.0" encoding="UTF-8"?>
+<response><header><total>1</total></header><results><result><metadata>
+<oaf:entity xmlns:oaf="http://namespace.openaire.eu/oaf"><oaf:result>
+<pid classid="doi" classname="doi">10.1016/j.appet.2017.07.006</pid>
+<title classid="main title">Deal or no deal?</title>
+<bestaccessright classid="OPEN" classname="Open Access"/>
+<creator rank="1">Taillie, Lindsey Smith</creator>
+<creator rank="2">Ng, Shu Wen</creator>
+<journal issn="0195-6663">Appetite</journal>
+<children><instance><webresource><url>https://europepmc.org/articles/PMC5574185/</url></webresource></instance></children>
+</oaf:result></oaf:entity></metadata></result></results></response>"""
+
+        expected = "OrderedDict([('doi', '10.1016/j.appet.2017.07.006'), ('title', 'Deal or no deal?'), ('url', 'https://europepmc.org/articles/PMC5574185/'), ('authors', ['Taillie, Lindsey Smith', 'Ng, Shu Wen']), ('journal', 'Appetite'), ('open', True)])"
+
+        # both parser backends must produce the same metadata
+        for xml_parser in ["etree", "html.parser"]:
+            schol.config["DEFAULT"]["xml_parser"] = xml_parser
+            root = source._parse_xml(response)
+            results = source._find_xml_nodes(root, "oaf:result")
+            self.assertTrue(source._get_xml_node_value(root, "total") == "1")
+            self.assertTrue(len(results) == 1)
+            self.assertTrue(repr(source._parse_result(results[0])) == expected)
+
+            # only descendants count, not the node itself
+            self.assertTrue(len(source._find_xml_nodes(results[0], "oaf:result")) == 0)
+            self.assertTrue(len(source._find_xml_nodes(results[0], "creator")) == 2)
+
+
     ######################################################################
     ## Digital Science family of APIs
 
@@ -683,5 +809,726 @@ class TestOpenAPIs (unittest.TestCase):
             self.assertTrue(response.title() == title)
 
 
+    ######################################################################
+    ## common infrastructure
+
+    def test_scholinfra__get_config (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        schol.config["DEFAULT"]["pool_size"] = "4"
+        schol.config["DEFAULT"]["semantic_scholar_pool_size"] = "2"
+
+        self.assertTrue(schol.crossref._get_config("pool_size") == "4")
+        self.assertTrue(schol.semantic._get_config("pool_size") == "2")
+        self.assertTrue(schol.semantic._get_config("xml_parser", "etree") == "etree")
+
+
+    def test_scholinfra__title_similarity (self):
+        source = rc_scholapi.ScholInfraAPI(config_file="rc.cfg").datacite
+        title = "Relation between household food insecurity and breastfeeding in Canada"
+
+        self.assertTrue(source.title_similarity(title, " relation between household food insecurity and breastfeeding in Canada.") == 1.0)
+        self.assertTrue(abs(source.title_similarity(title, title.replace("Canada", "Canadas")) - 70 / 71) < 1e-9)
+        self.assertTrue(source.title_similarity(title, None) == 0.0)
+
+        # below the threshold, the similarity exits early as 0.0
+        self.assertTrue(0.0 < source.title_similarity(title, "Household food insecurity in Canada") < 0.9)
+        self.assertTrue(source.title_similarity(title, "Household food insecurity in Canada", 0.9) == 0.0)
+
+
+    def test_scholinfra__title_key (self):
+        source = rc_scholapi.ScholInfraAPI(config_file="rc.cfg").europepmc
+        key = rc_scholapi.TitleKey("Deal or no deal?  The prevalence of price promotions.")
+
+        # normalized once, then usable for matching and as a dict key
+        self.assertTrue(str(key) == "deal or no deal? the prevalence of price promotions")
+        self.assertTrue(source.title_match(key, "deal or no deal? The prevalence of price promotions"))
+        self.assertTrue(key == rc_scholapi.TitleKey(" Deal or no deal? The prevalence of price promotions"))
+        self.assertTrue({ key: 1 }.get(rc_scholapi.TitleKey("deal or no deal? the prevalence of price promotions")) == 1)
+        self.assertFalse(source.title_match(rc_scholapi.TitleKey(None), None))
+
+        # diacritics, dashes, quotes, and HTML entities get folded too
+        self.assertTrue(source.title_match("Café — “Déjà vu” &amp; the ﬁrst study", 'cafe - "deja vu" & the first study'))
+        self.assertTrue(str(rc_scholapi.TitleKey("Ångström − «Übersicht»")) == 'angstrom - "ubersicht')
+
+        # as do the nonspacing marks of other scripts
+        self.assertTrue(source.title_match("מחקר על בְּרֵאשִׁית", "מחקר על בראשית"))
+        self.assertTrue(source.title_match("دراسة عن الْعَرَبِيَّة", "دراسة عن العربية"))
+
+
+    def test_scholinfra__get_session (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        source = schol.crossref
+
+        # the pooled session gets reused across calls, until closed
+        session = source._get_session()
+        self.assertTrue(source._get_session() is session)
+        self.assertTrue(schol.datacite._get_session() is not session)
+
+        schol.close()
+        self.assertTrue(source._get_session() is not session)
+
+
+    def test_scholinfra__get_cached (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+
+        # each provider has its own cache, with its own expiration
+        session = schol.crossref._get_session()
+        self.assertTrue(isinstance(session, requests_cache.CachedSession))
+        self.assertTrue(session.cache is not schol.unpaywall._get_session().cache)
+        self.assertTrue(schol.crossref._get_cache_expire() == 30 * 24 * 3600)
+        self.assertTrue(schol.unpaywall._get_cache_expire() == 24 * 3600)
+
+        # without patching `requests` for the rest of the process
+        self.assertFalse(isinstance(requests.Session(), requests_cache.CachedSession))
+
+        # a cache miss doesn't make a request
+        self.assertTrue(schol.crossref._get_cached("https://api.crossref.org/works?query=not-cached") is None)
+
+        schol.config["DEFAULT"]["cache"] = "false"
+        self.assertTrue(schol.datacite._get_cached("https://api.datacite.org/dois/10.22002/d1.246") is None)
+
+
+    def test_scholinfra__cached_stream (self):
+        results = "".join([ "<result><oaf:result><title>Title {}</title></oaf:result></result>".format(i) for i in range(50) ])
+        body = '<response xmlns:oaf="http://namespace.openaire.eu/oaf"><header><total>50</total></header><results>{}</results></response>'.format(results)
+        server, requests_made = serve_locally(body)
+
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        schol.config["DEFAULT"]["cache_backend"] = "memory"
+        source = schol.openaire
+        source.api_url = "http://127.0.0.1:{}/search?".format(server.server_address[1])
+
+        # a page cached by the html.parser backend parses the same from
+        # the cache, while streamed pages bypass the cache
+        try:
+            for xml_parser in ["html.parser", "etree", "etree"]:
+                schol.config["DEFAULT"]["xml_parser"] = xml_parser
+                responses = list(source.iter_full_text_search("x", page_size=50))
+                self.assertTrue(len(responses) == 50 and responses[-1].meta["title"] == "Title 49")
+
+            self.assertTrue(len(requests_made) == 1)
+
+            for i in range(2):
+                responses = list(source.iter_full_text_search("y", page_size=50))
+                self.assertTrue(len(responses) == 50)
+
+            self.assertTrue(len(requests_made) == 3)
+        finally:
+            schol.close()
+            server.shutdown()
+
+
+    def test_scholinfra__iterparse_xml (self):
+        record = '<result><header><id>{}</id></header><metadata><oaf:entity><oaf:result><title>Title {}</title></oaf:result></oaf:entity></metadata></result>'
+
+        def parse (count):
+            records = "".join([ record.format(i, i) for i in range(count) ])
+            body = '<response xmlns:oaf="http://namespace.openaire.eu/oaf"><results>{}</results></response>'.format(records)
+            source = io.BytesIO(body.encode("utf-8"))
+
+            tracemalloc.start()
+
+            try:
+                count = 0
+
+                for node in rc_scholapi.scholapi._ScholInfra._iterparse_xml(source, "oaf:result"):
+                    title = rc_scholapi.scholapi._ScholInfra._get_xml_node_value(node, "title")
+                    count += 1
+
+                return count, title, tracemalloc.get_traced_memory()[1]
+            finally:
+                tracemalloc.stop()
+
+        # the wrapper elements around each match don't accumulate, so
+        # peak memory stays flat as the number of records grows
+        count, title, small_peak = parse(1000)
+        self.assertTrue(count == 1000 and title == "Title 999")
+
+        count, title, large_peak = parse(10000)
+        self.assertTrue(count == 10000)
+        self.assertTrue(large_peak < 2 * small_peak)
+
+
+    def test_scholinfra__negative_cache (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        schol.config["DEFAULT"]["cache_backend"] = "memory"
+        source = schol.crossref
+        queries = []
+
+        def no_match (title):
+            queries.append(title)
+            return source.response_class(source, None, 0.0, None)
+            yield
+
+        source._title_search_steps = no_match
+
+        # a title which found no match doesn't get queried again
+        for title in ["No Such Title", " no such title? "]:
+            response = source.title_search(title)
+            self.assertTrue(response.meta is None and response.message is None)
+
+        self.assertTrue(queries == ["No Such Title"])
+
+        # unless negative caching gets disabled
+        schol.config["DEFAULT"]["negative_cache_expire"] = "0"
+        source.title_search("Another Title")
+        source.title_search("Another Title")
+        self.assertTrue(queries == ["No Such Title", "Another Title", "Another Title"])
+
+        # an error left after retries doesn't get cached as a miss
+        server, requests_made = serve_locally("<responseWrapper/>", status=503)
+        schol.config["DEFAULT"]["negative_cache_expire"] = "3600"
+        schol.config["DEFAULT"]["max_retries"] = "0"
+        source = schol.europepmc
+        source.api_url = "http://127.0.0.1:{}/search?query={{}}".format(server.server_address[1])
+
+        try:
+            for i in range(2):
+                response = source.title_search("Down For Maintenance")
+                self.assertTrue(response.meta is None and response.message is not None)
+
+            self.assertTrue(len(requests_made) == 2)
+        finally:
+            server.shutdown()
+
+        # a miss stays out of the HTTP cache, so that it only gets
+        # remembered for `negative_cache_expire`, synchronous or async
+        server, requests_made = serve_locally("<responseWrapper><resultList/></responseWrapper>")
+        source.api_url = "http://127.0.0.1:{}/search?query={{}}".format(server.server_address[1])
+
+        async def search (title):
+            async_source = rc_scholapi.scholapi._AsyncScholInfra(source)
+
+            try:
+                return await async_source.title_search(title)
+            finally:
+                await async_source.close()
+
+        try:
+            response = source.title_search("Nothing Like This")
+            self.assertTrue(response.meta is None and response.message is None)
+            self.assertTrue(source._get_cached(source.api_url.format(urllib.parse.quote("Nothing Like This"))) is None)
+
+            schol.config["DEFAULT"]["negative_cache_expire"] = "0"
+
+            for i in range(2):
+                source.title_search("Nothing Like That")
+                asyncio.run(search("Nothing Like That"))
+
+            self.assertTrue(len(requests_made) == 5)
+        finally:
+            server.shutdown()
+
+        # nor does an error reported by the Dimensions API
+        source = schol.dimensions
+        source._login = lambda: None
+        source.api_obj = unittest.mock.Mock()
+        source.api_obj.query.return_value = rc_scholapi.scholapi.dimcli.DslDataset({"errors": {"query": "error"}})
+
+        for i in range(2):
+            response = source.title_search("Down For Maintenance")
+            self.assertTrue(response.meta is None and response.message is not None)
+
+        self.assertTrue(source.api_obj.query.call_count == 2)
+
+
+    def test_scholinfra__get_cached_result (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        schol.config["DEFAULT"]["cache_backend"] = "memory"
+        source = schol.pubmed
+        calls = []
+
+        def compute ():
+            calls.append(1)
+            return ["31488624"]
+
+        # results from libraries which bypass the HTTP cache get cached too
+        for i in range(2):
+            result = source._get_cached_result("esearch_title", ["Deal or no deal?"], compute)
+            self.assertTrue(result == ["31488624"])
+
+        self.assertTrue(len(calls) == 1)
+
+        # separately per provider, and never for an uncacheable result
+        schol.dimensions._get_cached_result("esearch_title", ["Deal or no deal?"], compute, lambda result: False)
+        schol.dimensions._get_cached_result("esearch_title", ["Deal or no deal?"], compute, lambda result: False)
+        self.assertTrue(len(calls) == 3)
+
+        # empty library results don't get cached for `cache_expire`
+        schol.config["DEFAULT"]["negative_cache_expire"] = "0"
+        source._esearch_title = unittest.mock.Mock(return_value=[])
+
+        source.title_search("No Such Title")
+        source.title_search(" no such title? ")
+        self.assertTrue(source._esearch_title.call_count == 2)
+
+        source = schol.dimensions
+        source._login = lambda: None
+        source.api_obj = unittest.mock.Mock()
+        source.api_obj.query.return_value = rc_scholapi.scholapi.dimcli.DslDataset({"publications": []})
+
+        source.title_search("No Such Title")
+        source.title_search("No Such Title")
+        self.assertTrue(source.api_obj.query.call_count == 2)
+
+
+    def test_scholinfra__browser_result_cache (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        schol.config["DEFAULT"]["cache_backend"] = "memory"
+        launches = []
+
+        def export_data (search_url, export_url, limit=None):
+            launches.append(search_url)
+            return [{"Title": "Deal or no deal?"}]
+
+        def search_url (title):
+            launches.append(title)
+            return "https://papers.ssrn.com/sol3/papers.cfm?abstract_id=1"
+
+        schol.nsfPar._export_data = export_data
+        schol.ssrn._search_url = search_url
+        schol.ssrn._lookup_url = lambda url: {"url": url}
+
+        # repeated lookups don't start another browser
+        for i in range(2):
+            response = schol.nsfPar.title_search("Deal or no deal?")
+            self.assertTrue(response.meta == {"Title": "Deal or no deal?"})
+
+            response = schol.ssrn.title_search("Deal or no deal?")
+            self.assertTrue(response.meta["url"].endswith("abstract_id=1"))
+
+        self.assertTrue(len(launches) == 2)
+
+        # although a search which found nothing does
+        schol.config["DEFAULT"]["negative_cache_expire"] = "0"
+        schol.ssrn._search_url = lambda title: launches.append(title)
+
+        for i in range(2):
+            response = schol.ssrn.title_search("No Such Title")
+            self.assertTrue(response.meta is None and response.message is None)
+
+        self.assertTrue(len(launches) == 4)
+
+
+    def test_scholinfra__browser_pool (self):
+        class FakeBrowser:
+            def __init__ (self):
+                self.alive = True
+
+            @property
+            def current_url (self):
+                if not self.alive:
+                    raise ConnectionError("browser crashed")
+                return "about:blank"
+
+            def quit (self):
+                self.alive = False
+
+        started = []
+
+        def factory ():
+            started.append(FakeBrowser())
+            return started[-1]
+
+        pool = rc_scholapi.scholapi._BrowserPool(factory, size=2, max_uses=3)
+
+        # browsers get reused, then recycled after `max_uses`
+        for i in range(4):
+            with pool.browser() as browser:
+                pass
+
+        self.assertTrue(len(started) == 2 and not started[0].alive)
+
+        # a crashed browser fails its health check and gets replaced
+        started[1].alive = False
+
+        with pool.browser() as browser:
+            self.assertTrue(browser is started[2])
+
+        # a browser which raised an exception still gets reused, unless
+        # its session died
+        with self.assertRaises(ValueError):
+            with pool.browser() as browser:
+                raise ValueError()
+
+        self.assertTrue(started[2].alive)
+
+        with self.assertRaises(ValueError):
+            with pool.browser() as browser:
+                self.assertTrue(browser is started[2])
+                browser.alive = False
+                raise ValueError()
+
+        with pool.browser() as browser:
+            self.assertTrue(browser is started[3])
+
+        pool.close()
+
+
+    def test_scholinfra__nsf_par_cookies (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        schol.config["DEFAULT"]["cache"] = "false"
+        source = schol.nsfPar
+        visits = []
+
+        class FakeBrowser:
+            current_url = "about:blank"
+
+            def get (self, url):
+                visits.append(url)
+
+            def get_cookies (self):
+                return [{"name": "PHPSESSID", "value": str(len(visits))}]
+
+            def quit (self):
+                pass
+
+        schol._browser_pool = rc_scholapi.scholapi._BrowserPool(FakeBrowser)
+        session = source._get_session()
+
+        def post (url, **kwargs):
+            response = requests.Response()
+            response.status_code = 200
+
+            # the first session cookie gets rejected
+            if session.cookies.get("PHPSESSID") == "1":
+                response.headers["Content-Type"] = "text/html"
+                response.raw = io.BytesIO(b"<html></html>")
+            else:
+                response.headers["Content-Type"] = "text/csv"
+                response.raw = io.BytesIO(b"Title,DOI\nDeal or no deal?,10.1016/j.appet.2017.07.006\n\"Two\nlines\",\n")
+
+            return response
+
+        session.post = post
+
+        # the browser only runs to get cookies, and again when they're rejected
+        for i in range(3):
+            rows = source._export_data("https://par.nsf.gov/search", "https://par.nsf.gov/export", limit=1)
+            self.assertTrue(rows == [{"Title": "Deal or no deal?", "DOI": "10.1016/j.appet.2017.07.006"}])
+
+        self.assertTrue(len(visits) == 2)
+
+        # the export gets parsed as a stream of CSV lines
+        rows = source._export_data("https://par.nsf.gov/search", "https://par.nsf.gov/export")
+        self.assertTrue(rows[1] == {"Title": "Two\nlines", "DOI": ""})
+        schol.close()
+
+
+    def test_scholinfra__rate_limiter (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+
+        # a full bucket permits a burst, then requests queue up
+        limiter = rc_scholapi.scholapi._RateLimiter(rate=10, burst=2)
+        delays = [ limiter.delay() for i in range(4) ]
+        self.assertTrue(delays[:2] == [0.0, 0.0])
+        self.assertTrue(0.05 < delays[2] < delays[3] <= 0.2)
+
+        # adapt to the rate limit headers returned by Crossref
+        limiter = schol.crossref._rate_limiter
+        limiter.update({"X-Rate-Limit-Limit": "25", "X-Rate-Limit-Interval": "1s"})
+        self.assertTrue(limiter.rate == 25.0)
+
+        # NCBI permits 3 requests per second without an API key
+        if "ncbi_api_key" not in schol.config["DEFAULT"]:
+            self.assertTrue(schol.pubmed._rate_limiter.rate == 3.0)
+
+        # Crossref DOI lookups go through the REST API, so get throttled
+        server, requests_made = serve_locally('{"message": {"DOI": "10.0/throttle"}}', content_type="application/json")
+        schol.config["DEFAULT"]["cache"] = "false"
+        schol.crossref.api_url = "http://127.0.0.1:{}/works?{{}}".format(server.server_address[1])
+
+        try:
+            with unittest.mock.patch.object(schol.crossref, "_throttle") as throttle:
+                response = schol.crossref.publication_lookup("10.0/throttle")
+
+            self.assertTrue(throttle.called)
+            self.assertTrue(response.meta["DOI"] == "10.0/throttle")
+            self.assertTrue(requests_made == [ "/works/10.0/throttle" ])
+        finally:
+            server.shutdown()
+
+
+    def test_scholinfra__get_retry_delay (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        source = schol.crossref
+
+        # honor `Retry-After`, as either seconds or a date in the past
+        self.assertTrue(source._get_retry_delay(0, {"Retry-After": "7"}) == 7.0)
+        self.assertTrue(source._get_retry_delay(0, {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}) == 0.0)
+
+        # otherwise exponential backoff with jitter, up to a maximum
+        for attempt in range(10):
+            delay = source._get_retry_delay(attempt)
+            self.assertTrue(0.0 <= delay <= min(60.0, 0.5 * 2 ** attempt))
+
+
+    def test_scholinfra__get_timeout (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        schol.config["DEFAULT"]["crossref_read_timeout"] = "20"
+        source = schol.crossref
+
+        self.assertTrue(source._get_timeout() == (10.0, 20.0))
+        self.assertTrue(schol.datacite._get_timeout() == (10.0, 30.0))
+
+        # a deadline cuts the timeouts short, then refuses requests
+        with schol.deadline(2.0):
+            connect, read = source._get_timeout()
+            self.assertTrue(0.0 < connect <= 2.0 and 0.0 < read <= 2.0)
+
+        with schol.deadline(0.0):
+            with self.assertRaises(rc_scholapi.scholapi._DeadlineExceeded):
+                source._get_timeout()
+
+        self.assertTrue(source._get_timeout() == (10.0, 20.0))
+
+        # Entrez requests get a socket timeout too, within the deadline
+        schol.config["DEFAULT"].setdefault("email", "info@example.org")
+
+        with unittest.mock.patch("urllib.request.urlopen") as urlopen:
+            with schol.deadline(2.0):
+                schol.pubmed._entrez_setup()
+                rc_scholapi.scholapi.Entrez.urlopen("https://eutils.ncbi.nlm.nih.gov/")
+
+            self.assertTrue(0.0 < urlopen.call_args[1]["timeout"] <= 2.0)
+
+
+    def test_scholinfra__get_hedge_delay (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        source = schol.semantic
+
+        for i in range(1, 101):
+            source._latency.add(i / 100.0)
+
+        # hedging is opt-in per provider
+        self.assertTrue(source._get_hedge_delay() is None)
+
+        schol.config["DEFAULT"]["semantic_scholar_hedge"] = "true"
+        self.assertTrue(source._get_hedge_delay() == 0.95)
+
+        schol.config["DEFAULT"]["semantic_scholar_hedge_percentile"] = "50"
+        self.assertTrue(source._get_hedge_delay() == 0.5)
+
+        # not until there are enough observations
+        self.assertTrue(rc_scholapi.scholapi._LatencyTracker().percentile(50) is None)
+
+
+    def test_scholinfra__circuit_breaker (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        schol.config["DEFAULT"]["dissemin_max_retries"] = "0"
+
+        source = schol.dissemin
+        source.api_url = "http://127.0.0.1:1/{}"
+        source._circuit_breaker = rc_scholapi.scholapi._CircuitBreaker(threshold=2, reset=60.0)
+
+        # connections get refused, until the circuit opens and calls fail fast
+        doi = "10.1016/j.appet.2017.07.006"
+        messages = [ source.publication_lookup(doi).message for i in range(3) ]
+        self.assertTrue(messages[:2] == ["ERROR: " + doi] * 2)
+        self.assertTrue(messages[2] == "CIRCUIT OPEN: " + doi)
+
+        responses = list(schol.federated_publication_lookup(doi, providers=["dissemin"]))
+        self.assertTrue(responses[0].message == "CIRCUIT OPEN: " + doi)
+
+        # once reset, one probe gets through and its result decides
+        breaker = rc_scholapi.scholapi._CircuitBreaker(threshold=1, reset=0.0)
+        breaker.record_failure()
+        self.assertTrue(breaker.allow())
+        self.assertFalse(breaker.allow())
+        breaker.record_success()
+        self.assertFalse(breaker.is_open())
+
+        # a probe which runs out of time doesn't leave the circuit stuck open
+        source._circuit_breaker = breaker
+        breaker.record_failure()
+
+        with self.assertRaises(rc_scholapi.scholapi._DeadlineExceeded):
+            with schol.deadline(0.0):
+                source._get(source._get_api_url(doi))
+
+        self.assertTrue(breaker.allow())
+
+        # direct calls fail fast with a message rather than raising
+        schol.config["DEFAULT"].setdefault("email", "info@example.org")
+
+        for source in [ schol.semantic, schol.unpaywall, schol.datacite, schol.crossref ]:
+            source._circuit_breaker = rc_scholapi.scholapi._CircuitBreaker(threshold=1, reset=60.0)
+            source._circuit_breaker.record_failure()
+            self.assertTrue(source.publication_lookup(doi).message == "CIRCUIT OPEN: " + doi)
+
+        response = schol.datacite.full_text_search("NHANES")[0]
+        self.assertTrue(response.message == "CIRCUIT OPEN: NHANES")
+
+        ssrn_doi = "10.2139/ssrn.2898991"
+        schol.ssrn._circuit_breaker = rc_scholapi.scholapi._CircuitBreaker(threshold=1, reset=60.0)
+        schol.ssrn._circuit_breaker.record_failure()
+        self.assertTrue(schol.ssrn.publication_lookup(ssrn_doi).message == "CIRCUIT OPEN: " + ssrn_doi)
+
+        schol.repec._circuit_breaker = rc_scholapi.scholapi._CircuitBreaker(threshold=1, reset=60.0)
+        schol.repec._circuit_breaker.record_failure()
+        self.assertTrue(schol.repec.get_handle("NHANES")[2] == "CIRCUIT OPEN: NHANES")
+
+        # NSF PAR exports don't launch a browser while the circuit is open
+        schol.nsfPar._circuit_breaker = rc_scholapi.scholapi._CircuitBreaker(threshold=1, reset=60.0)
+        schol.nsfPar._circuit_breaker.record_failure()
+        self.assertTrue(schol.nsfPar.publication_lookup(doi).message == "CIRCUIT OPEN: " + doi)
+        self.assertTrue(schol._browser_pool is None)
+
+        # client library calls count toward the circuit breaker, except
+        # for errors which mean that the provider responded
+        source = schol.pubmed
+        source._circuit_breaker = rc_scholapi.scholapi._CircuitBreaker(threshold=1, reset=60.0)
+
+        with self.assertRaises(ValueError):
+            source._call_library("efetch", int, "x", ignore=ValueError)
+
+        self.assertFalse(source._circuit_breaker.is_open())
+
+        with self.assertRaises(ValueError):
+            source._call_library("efetch", int, "x")
+
+        self.assertTrue(source.title_search("NHANES").message == "CIRCUIT OPEN: NHANES")
+
+        # transient errors from client libraries get retried too
+        source._circuit_breaker = rc_scholapi.scholapi._CircuitBreaker(threshold=1, reset=60.0)
+        schol.config["DEFAULT"]["pubmed_max_retries"] = "2"
+        schol.config["DEFAULT"]["pubmed_retry_backoff"] = "0.01"
+        flaky = unittest.mock.Mock(side_effect=[ ConnectionError(), urllib.error.HTTPError("", 503, "", {}, None), "ok" ])
+
+        self.assertTrue(source._call_library("efetch", flaky) == "ok")
+        self.assertTrue(flaky.call_count == 3)
+        self.assertFalse(source._circuit_breaker.is_open())
+
+        flaky = unittest.mock.Mock(side_effect=urllib.error.HTTPError("", 400, "", {}, None))
+
+        with self.assertRaises(urllib.error.HTTPError):
+            source._call_library("efetch", flaky)
+
+        self.assertTrue(flaky.call_count == 1)
+
+
+    ######################################################################
+    ## federated API access
+
+    def test_federated_publication_lookup (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        providers = ["crossref", "datacite", "dissemin"]
+
+        doi = "10.1016/j.appet.2017.07.006"
+        responses = list(schol.federated_publication_lookup(doi, providers=providers))
+        self.assertTrue(len(responses) == len(providers))
+
+        for response in responses:
+            if response.meta:
+                self.assertTrue(response.doi().lower() == doi)
+
+
+    def test_federated_title_search (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        providers = ["crossref", "europepmc", "repec"]
+
+        # RePEc does not implement `title_search()` so gets skipped
+        title = "Relation between household food insecurity and breastfeeding in Canada"
+        responses = list(schol.federated_title_search(title, providers=providers))
+        self.assertTrue(len(responses) == 2)
+
+
+    def test_federated_deadline (self):
+        schol = rc_scholapi.ScholInfraAPI(config_file="rc.cfg")
+        doi = "10.1016/j.appet.2017.07.006"
+
+        # a provider call which the deadline cannot interrupt
+        def slow_lookup (identifier):
+            time.sleep(3.0)
+
+        with unittest.mock.patch.object(schol.crossref, "publication_lookup", slow_lookup):
+            t0 = time.monotonic()
+            responses = list(schol.federated_publication_lookup(doi, providers=["crossref"], deadline=0.5))
+
+        self.assertTrue(time.monotonic() - t0 < 1.5)
+        self.assertTrue(len(responses) == 1)
+        self.assertTrue(responses[0].meta is None)
+        self.assertTrue(responses[0].message.startswith("ERROR"))
+
+
+    ######################################################################
+    ## asyncio API access
+
+    def test_async_publication_lookup (self):
+        doi = "10.22002/d1.246"
+        title = "In Situ Carbon Dioxide and Methane Mole Fractions from the Los Angeles Megacity Carbon Project"
+
+        async def lookup ():
+            async with rc_scholapi.AsyncScholInfraAPI(config_file="rc.cfg") as schol:
+                # both run natively, without the executor
+                return await asyncio.gather(
+                    schol.datacite.publication_lookup(doi),
+                    schol.crossref.publication_lookup("10.1016/j.appet.2017.07.006"),
+                    )
+
+        response, crossref_response = asyncio.run(lookup())
+        self.assertTrue(response.doi() == doi)
+        self.assertTrue(response.title() == title)
+        self.assertTrue(crossref_response.meta is not None)
+
+
+    def test_async_get_cached (self):
+        doi = "10.22002/d1.246"
+        body = '{"data": {"id": "10.22002/d1.246", "attributes": {"doi": "10.22002/d1.246"}}}'
+        server, requests_made = serve_locally(body, content_type="application/json")
+
+        async def lookup (schol):
+            async with schol:
+                return await schol.datacite.publication_lookup(doi)
+
+        schol = rc_scholapi.AsyncScholInfraAPI(config_file="rc.cfg")
+        schol.config["DEFAULT"]["cache_backend"] = "memory"
+        schol.datacite.source.api_url = "http://127.0.0.1:{}/dois{{}}".format(server.server_address[1])
+
+        # the async provider uses responses which the sync provider cached
+        try:
+            response = schol.datacite.source.publication_lookup(doi)
+            self.assertTrue(response.meta["id"] == doi)
+
+            response = asyncio.run(lookup(schol))
+            self.assertTrue(response.meta["id"] == doi)
+            self.assertTrue(len(requests_made) == 1)
+        finally:
+            server.shutdown()
+
+        # the sync provider uses responses which the async provider cached
+        server, requests_made = serve_locally(body, content_type="application/json")
+
+        schol = rc_scholapi.AsyncScholInfraAPI(config_file="rc.cfg")
+        schol.config["DEFAULT"]["cache_backend"] = "memory"
+        schol.datacite.source.api_url = "http://127.0.0.1:{}/dois{{}}".format(server.server_address[1])
+
+        async def lookup_both (schol):
+            async with schol:
+                response = await schol.datacite.publication_lookup(doi)
+                return response, schol.datacite.source.publication_lookup(doi)
+
+        try:
+            for response in asyncio.run(lookup_both(schol)):
+                self.assertTrue(response.meta["id"] == doi)
+
+            self.assertTrue(len(requests_made) == 1)
+        finally:
+            server.shutdown()
+
+
+    def test_async_federated_title_search (self):
+        title = "Relation between household food insecurity and breastfeeding in Canada"
+        providers = ["crossref", "europepmc", "repec"]
+
+        async def search ():
+            async with rc_scholapi.AsyncScholInfraAPI(config_file="rc.cfg") as schol:
+                return [ response async for response in schol.federated_title_search(title, providers=providers) ]
+
+        # RePEc does not implement `title_search()` so gets skipped
+        responses = asyncio.run(search())
+        self.assertTrue(len(responses) == 2)
+
+
 if __name__ == "__main__":
     unittest.main()